@@ -165,4 +165,7 @@ Use descriptive IDs for your references.
 """
 
 # Registry of FD-related tools that should not trigger recursive FD creation
-FD_RELATED_TOOLS = {"read_fd", "fd_to_file"}
+FD_RELATED_TOOLS = frozenset({"read_fd", "fd_to_file"})
+
+# Buffer size used when writing file descriptor content to disk
+FD_WRITE_BUFFER_SIZE = 128 * 1024
@@ -4,7 +4,6 @@ This module contains the FileDescriptorManager class that centrally manages
 file descriptors, their creation, access, and lifecycle within an LLMProcess.
 """
 
-import copy
 import logging
 import os
 import time
@@ -22,7 +21,7 @@ from llmproc.file_descriptors._docs_manager import (
     PROCESS_REFERENCES,
     REGISTER_FD_TOOL,
 )
-from llmproc.file_descriptors.constants import FD_RELATED_TOOLS
+from llmproc.file_descriptors.constants import FD_RELATED_TOOLS, FD_WRITE_BUFFER_SIZE
 from llmproc.file_descriptors.formatter import (
     format_fd_content,
     format_fd_error,
@@ -35,6 +34,7 @@ from llmproc.file_descriptors.paginator import (
     extract_content_by_mode,
     get_page_content,
     index_lines,
+    index_pages,
 )
 from llmproc.file_descriptors.references import (
     extract_references,
@@ -63,8 +63,11 @@ class FileDescriptorManager:
         self.max_input_chars = max_input_chars
         self.page_user_input = page_user_input
         self.enable_references = enable_references
-        self.fd_related_tools = FD_RELATED_TOOLS.copy()
+        self.fd_related_tools: set[str] = set(FD_RELATED_TOOLS)
         self.next_fd_id = 1  # Counter for sequential FD IDs
+        # Payloads already stored, keyed by their own value, with their line index.
+        # Identical content reuses one string and skips re-indexing.
+        self._payloads: dict[str, tuple[str, list[int], int]] = {}
 
     def is_fd_related_tool(self, tool_name: str) -> bool:
         """Check if a tool is related to the file descriptor system.
@@ -88,11 +91,11 @@ class FileDescriptorManager:
             tuple: (fd_content, used_fd) where fd_content is either the original content
             or the FD result, and used_fd is a boolean indicating if FD was created
         """
-        # Check if FD system should be used
+        # Check if FD system should be used; small output, the common case, exits first
         if (
             not isinstance(content, str)
-            or (tool_name and self.is_fd_related_tool(tool_name))
             or len(content) <= self.max_direct_output_chars
+            or (tool_name and self.is_fd_related_tool(tool_name))
         ):
             return content, False
 
@@ -110,8 +113,8 @@ class FileDescriptorManager:
         """
         self.fd_related_tools.add(tool_name)
 
-    def create_fd_content(self, content: str, page_size: int | None = None, source: str = "tool_result") -> str:
-        """Create a new file descriptor for large content.
+    def create_fd(self, content: str, page_size: int | None = None, source: str = "tool_result") -> tuple[str, str]:
+        """Create a new file descriptor and return its ID alongside the XML result.
 
         Args:
             content: The content to store in the file descriptor
@@ -119,7 +122,7 @@ class FileDescriptorManager:
             source: Source of the content (e.g., "tool_result", "user_input")
 
         Returns:
-            Formatted XML string with file descriptor information
+            Tuple of (fd_id, formatted XML string with file descriptor information)
         """
         # Generate a sequential ID for the file descriptor
         fd_id = f"fd:{self.next_fd_id}"
@@ -128,13 +131,20 @@ class FileDescriptorManager:
         # Use default page size if none provided
         page_size = page_size or self.default_page_size
 
-        # Create line index for line-aware pagination
-        lines, total_lines = index_lines(content)
+        # Create line index for line-aware pagination (reused for repeated payloads),
+        # and resolve every page's line span once so page reads don't rescan the index
+        payload = self._payloads.get(content)
+        if payload is None:
+            payload = (content, *index_lines(content))
+            self._payloads[content] = payload
+        content, lines, total_lines = payload
+        page_spans = index_pages(content, lines, page_size)
 
         # Store the file descriptor entry with minimal info first
         self.file_descriptors[fd_id] = {
             "content": content,
             "lines": lines,  # Start indices of each line
+            "page_spans": page_spans,  # (start_line, end_line, continued, truncated) per page
             "total_lines": total_lines,
             "page_size": page_size,
             "creation_time": time.time(),
@@ -142,7 +152,7 @@ class FileDescriptorManager:
         }
 
         # Generate preview content (first page)
-        preview_content, preview_info = get_page_content(content, lines, page_size, start_pos=1)
+        preview_content, preview_info = get_page_content(content, lines, page_size, start_pos=1, page_spans=page_spans)
 
         # Calculate the actual number of pages by simulating pagination
         num_pages = calculate_total_pages(content, lines, page_size)
@@ -165,47 +175,47 @@ class FileDescriptorManager:
         logger.debug(f"Created file descriptor {fd_id} with {num_pages} pages, {total_lines} lines, source: {source}")
 
         # Format the response in standardized XML format
-        return format_fd_result(fd_result)
+        return fd_id, format_fd_result(fd_result)
 
-    def read_fd_content(
+    def create_fd_content(self, content: str, page_size: int | None = None, source: str = "tool_result") -> str:
+        """Create a new file descriptor for large content.
+
+        Args:
+            content: The content to store in the file descriptor
+            page_size: Characters per page (defaults to default_page_size)
+            source: Source of the content (e.g., "tool_result", "user_input")
+
+        Returns:
+            Formatted XML string with file descriptor information
+        """
+        _, fd_xml = self.create_fd(content, page_size=page_size, source=source)
+        return fd_xml
+
+    def read_fd_raw(
         self,
         fd_id: str,
         read_all: bool = False,
-        extract_to_new_fd: bool = False,
         mode: str = "page",
         start: int = 1,
         count: int = 1,
-    ) -> str:
-        """Read content from a file descriptor and return formatted XML string.
+    ) -> tuple[str, dict[str, Any]]:
+        """Read raw content and position metadata from a file descriptor.
 
         Args:
             fd_id: The file descriptor ID to read from
             read_all: If True, returns the entire content
-            extract_to_new_fd: If True, creates a new file descriptor with the content and returns its ID
             mode: Positioning mode: "page" (default), "line", or "char"
             start: Starting position in the specified mode's units (page number, line number, or character position)
             count: Number of units to read (pages, lines, or characters)
 
         Returns:
-            Formatted XML string with content and metadata
+            Tuple of (content, metadata) where metadata holds the XML attributes for the read
 
         Raises:
             KeyError: If the file descriptor is not found
             ValueError: If the start position is invalid or if the range parameters are invalid
         """
-        # Validate file descriptor exists
-        if fd_id not in self.file_descriptors:
-            # Give a more helpful error for sequential FD numbering
-            available_fds = ", ".join(sorted(self.file_descriptors.keys()))
-            error_msg = f"File descriptor {fd_id} not found. Available FDs: {available_fds or 'none'}"
-            logger.error(error_msg)
-            raise KeyError(error_msg)
-
-        fd_entry = self.file_descriptors[fd_id]
-
-        # Prepare to get content based on read parameters
-        content_to_return = None
-        content_metadata = {}
+        fd_entry = self._get_fd_entry(fd_id)
 
         # Validate mode parameter
         if mode not in ["page", "line", "char"]:
@@ -216,13 +226,10 @@ class FileDescriptorManager:
         # Handle read_all case (highest priority)
         if read_all:
             # Read the entire content regardless of other positioning parameters
-            total_pages = fd_entry["total_pages"]
-
-            content_to_return = fd_entry["content"]
             content_metadata = {
                 "fd": fd_id,
                 "page": "all",
-                "pages": total_pages,
+                "pages": fd_entry["total_pages"],
                 "continued": False,
                 "truncated": False,
                 "lines": f"1-{fd_entry['total_lines']}",
@@ -231,31 +238,71 @@ class FileDescriptorManager:
             }
 
             logger.debug(f"Read all content from {fd_id}")
+            return fd_entry["content"], content_metadata
 
         # Handle positioning modes
-        else:
-            content_to_return, content_metadata = extract_content_by_mode(
-                content=fd_entry["content"],
-                lines=fd_entry["lines"],
-                mode=mode,
-                start=start,
-                count=count,
-                total_lines=fd_entry["total_lines"],
-                page_size=fd_entry["page_size"],
-                total_pages=fd_entry["total_pages"],
-            )
-
-            # Add fd_id to metadata
-            content_metadata["fd"] = fd_id
+        content_to_return, content_metadata = extract_content_by_mode(
+            content=fd_entry["content"],
+            lines=fd_entry["lines"],
+            mode=mode,
+            start=start,
+            count=count,
+            total_lines=fd_entry["total_lines"],
+            page_size=fd_entry["page_size"],
+            total_pages=fd_entry["total_pages"],
+            page_spans=fd_entry.get("page_spans"),
+        )
+
+        # Add fd_id to metadata
+        content_metadata["fd"] = fd_id
+
+        return content_to_return, content_metadata
+
+    def _get_fd_entry(self, fd_id: str) -> dict[str, Any]:
+        """Return the entry for a file descriptor, raising KeyError if it does not exist."""
+        fd_entry = self.file_descriptors.get(fd_id)
+        if fd_entry is None:
+            # Give a more helpful error for sequential FD numbering
+            available_fds = ", ".join(sorted(self.file_descriptors.keys()))
+            error_msg = f"File descriptor {fd_id} not found. Available FDs: {available_fds or 'none'}"
+            logger.error(error_msg)
+            raise KeyError(error_msg)
+        return fd_entry
+
+    def read_fd_content(
+        self,
+        fd_id: str,
+        read_all: bool = False,
+        extract_to_new_fd: bool = False,
+        mode: str = "page",
+        start: int = 1,
+        count: int = 1,
+    ) -> str:
+        """Read content from a file descriptor and return formatted XML string.
+
+        Args:
+            fd_id: The file descriptor ID to read from
+            read_all: If True, returns the entire content
+            extract_to_new_fd: If True, creates a new file descriptor with the content and returns its ID
+            mode: Positioning mode: "page" (default), "line", or "char"
+            start: Starting position in the specified mode's units (page number, line number, or character position)
+            count: Number of units to read (pages, lines, or characters)
+
+        Returns:
+            Formatted XML string with content and metadata
+
+        Raises:
+            KeyError: If the file descriptor is not found
+            ValueError: If the start position is invalid or if the range parameters are invalid
+        """
+        content_to_return, content_metadata = self.read_fd_raw(
+            fd_id, read_all=read_all, mode=mode, start=start, count=count
+        )
 
         # Check if we should extract the content to a new FD
         if extract_to_new_fd and content_to_return:
             # Create a new file descriptor with the content
-            new_fd_xml = self.create_fd_content(content_to_return)
-
-            # Extract the new FD ID from the result
-            # Note: This pattern is a bit fragile and depends on the XML format
-            new_fd_id = new_fd_xml.split('fd="')[1].split('"')[0]
+            new_fd_id, _ = self.create_fd(content_to_return)
 
             # Return a special response indicating the content was extracted to a new FD
             extraction_result = {
@@ -347,9 +394,11 @@ class FileDescriptorManager:
         file_mode = "w" if mode == "write" else "a"
         operation_type = "written" if mode == "write" else "appended"
 
-        # Write the file
-        with open(file_path, file_mode, encoding="utf-8") as f:
-            f.write(content)
+        # Write in buffer-sized slices so only one slice is encoded at a time,
+        # instead of holding a full encoded copy of large content
+        with open(file_path, file_mode, encoding="utf-8", buffering=FD_WRITE_BUFFER_SIZE) as f:
+            for offset in range(0, len(content), FD_WRITE_BUFFER_SIZE):
+                f.write(content[offset : offset + FD_WRITE_BUFFER_SIZE])
 
         # Create success message
         success_msg = (
@@ -388,10 +437,7 @@ class FileDescriptorManager:
             return user_input
 
         # Create a file descriptor for the large user input
-        fd_xml = self.create_fd_content(content=user_input, source="user_input")
-
-        # Extract the FD ID from the result
-        fd_id = fd_xml.split('fd="')[1].split('"')[0]
+        fd_id, _ = self.create_fd(content=user_input, source="user_input")
 
         # Format a user message that references the file descriptor
         formatted_message = format_user_input_reference(user_input, fd_id, max_preview_chars=self.max_input_chars // 20)
@@ -429,14 +475,18 @@ class FileDescriptorManager:
     # ------------------------------------------------------------------
 
     def clone(self) -> "FileDescriptorManager":
-        """Return a deep‑cloned copy of this manager for forked processes.
+        """Return an independent copy of this manager for forked processes.
 
-        This method creates a complete, independent copy of the file descriptor manager,
+        This method creates an independent copy of the file descriptor manager,
         including all file descriptors and settings. It's used specifically by the
         fork tool to ensure proper isolation between parent and child processes.
 
+        Each FD entry dict is copied, but the stored content and its line/page
+        indexes are shared: they are never mutated after creation, so sharing them
+        avoids duplicating large payloads on every fork.
+
         Returns:
-            A deep copy of this FileDescriptorManager with independent state
+            A copy of this FileDescriptorManager with independent state
         """
         cloned = FileDescriptorManager(
             default_page_size=self.default_page_size,
@@ -446,7 +496,8 @@ class FileDescriptorManager:
             enable_references=self.enable_references,
         )
 
-        cloned.file_descriptors = copy.deepcopy(self.file_descriptors)
+        cloned.file_descriptors = {fd_id: dict(entry) for fd_id, entry in self.file_descriptors.items()}
+        cloned._payloads = self._payloads.copy()
         cloned.fd_related_tools = self.fd_related_tools.copy()
         cloned.next_fd_id = self.next_fd_id
         return cloned
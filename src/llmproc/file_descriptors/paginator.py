@@ -4,6 +4,8 @@ This module handles line-aware pagination and content extraction for file descri
 It enables efficient access to large content by page, line, or character position.
 """
 
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import Any
 
 
@@ -16,15 +18,55 @@ def index_lines(content: str) -> tuple[list[int], int]:
     Returns:
         Tuple of (list of line start indices, total line count)
     """
-    lines = [0]  # First line always starts at index 0
-    for i, char in enumerate(content):
-        if char == "\n" and i + 1 < len(content):
-            lines.append(i + 1)
+    # Each line starts one past the end of the previous one; the first starts at 0
+    parts = content.split("\n")
+    lines = list(accumulate((len(part) + 1 for part in parts[:-1]), initial=0))
+    # A trailing newline does not start a new line
+    if len(lines) > 1 and lines[-1] == len(content):
+        lines.pop()
 
     return lines, len(lines)
 
 
-def get_page_content(content: str, lines: list[int], page_size: int, start_pos: int) -> tuple[str, dict[str, Any]]:
+def index_pages(content: str, lines: list[int], page_size: int) -> list[tuple[int, int, bool, bool]]:
+    """Precompute the line span of every page window.
+
+    Produces the same boundaries get_page_content would compute for each page,
+    so later page reads can skip the line search.
+
+    Args:
+        content: The full content string
+        lines: List of line start indices
+        page_size: Maximum characters per page
+
+    Returns:
+        List of (start_line, end_line, continued, truncated) tuples, one per page
+    """
+    content_length = len(content)
+    spans = []
+    for start_char in range(0, content_length, page_size):
+        end_char = min(start_char + page_size, content_length)
+
+        # Line containing start_char, and last line starting before end_char
+        start_line = bisect_right(lines, start_char)
+        end_line = bisect_left(lines, end_char)
+
+        continued = start_char > 0 and start_line > 1 and start_char != lines[start_line - 1]
+        next_line_start = lines[end_line] if end_line < len(lines) else content_length
+        truncated = end_char < next_line_start
+
+        spans.append((start_line, end_line, continued, truncated))
+
+    return spans
+
+
+def get_page_content(
+    content: str,
+    lines: list[int],
+    page_size: int,
+    start_pos: int,
+    page_spans: list[tuple[int, int, bool, bool]] | None = None,
+) -> tuple[str, dict[str, Any]]:
     """Get content for a specific page position with line-aware pagination.
 
     Args:
@@ -32,6 +74,7 @@ def get_page_content(content: str, lines: list[int], page_size: int, start_pos:
         lines: List of line start indices
         page_size: Maximum characters per page
         start_pos: The starting page position (1-based)
+        page_spans: Optional page spans from index_pages; skips the line scan when given
 
     Returns:
         Tuple of (content, position information)
@@ -41,6 +84,15 @@ def get_page_content(content: str, lines: list[int], page_size: int, start_pos:
     # Calculate page boundaries
     start_char = (start_pos - 1) * page_size
 
+    if page_spans is not None and 0 <= start_pos - 1 < len(page_spans):
+        start_line, end_line, continued, truncated = page_spans[start_pos - 1]
+        return content[start_char : start_char + page_size], {
+            "start_line": start_line,
+            "end_line": end_line,
+            "continued": continued,
+            "truncated": truncated,
+        }
+
     # Handle case where start_char is beyond the content length
     if start_char >= len(content):
         # Return empty content with info showing we're beyond content
@@ -55,28 +107,18 @@ def get_page_content(content: str, lines: list[int], page_size: int, start_pos:
     end_char = min(start_char + page_size, len(content))
 
     # Find line boundaries for better pagination
-    start_line = 1
-    end_line = 1
     continued = False
     truncated = False
 
     # Find the start line (the line containing start_char)
-    for i, line_start in enumerate(lines):
-        if line_start > start_char:
-            start_line = i  # The previous line
-            break
-        start_line = i + 1
+    start_line = bisect_right(lines, start_char)
 
     # Check if we're continuing from previous page (not starting at line boundary)
     if start_char > 0 and start_line > 1 and start_char != lines[start_line - 1]:
         continued = True
 
-    # Find the end line (the line containing or after end_char)
-    for i, line_start in enumerate(lines):
-        if line_start >= end_char:
-            end_line = i  # The previous line
-            break
-        end_line = i + 1
+    # Find the end line (the last line starting before end_char)
+    end_line = bisect_left(lines, end_char)
 
     # Check if we're truncating (not ending at line boundary)
     next_line_start = len(content)
@@ -118,27 +160,24 @@ def calculate_total_pages(content: str, lines: list[int], page_size: int) -> int
         return 1
 
     # For larger content, iterate through the pages
+    content_length = len(content)
+    line_count = len(lines)
     start_char = 0
     page_count = 0
+    end_line = 0
 
-    while start_char < len(content):
+    while start_char < content_length:
         page_count += 1
 
         # Calculate end of current page
-        end_char = min(start_char + page_size, len(content))
-
-        # Find the end line for this page
-        end_line = 1
+        end_char = min(start_char + page_size, content_length)
 
-        # Find the end line for this page
-        for i, line_start in enumerate(lines):
-            if line_start >= end_char:
-                end_line = i  # The previous line
-                break
-            end_line = i + 1
+        # Find the end line for this page (the last line starting before end_char),
+        # searching only past the lines already consumed
+        end_line = bisect_left(lines, end_char, end_line)
 
         # Determine the start of the next page
-        if end_line < len(lines):
+        if end_line < line_count:
             start_char = lines[end_line]
         else:
             # No more lines, we're done
@@ -156,6 +195,7 @@ def extract_content_by_mode(
     total_lines: int,
     page_size: int,
     total_pages: int,
+    page_spans: list[tuple[int, int, bool, bool]] | None = None,
 ) -> tuple[str, dict[str, Any]]:
     """Extract content from a string based on positioning mode.
 
@@ -168,6 +208,7 @@ def extract_content_by_mode(
         total_lines: Total number of lines in the content
         page_size: Size of each page in characters
         total_pages: Total number of pages
+        page_spans: Optional precomputed page spans from index_pages
 
     Returns:
         Tuple of (extracted content, position metadata)
@@ -221,21 +262,10 @@ def extract_content_by_mode(
 
         # For line numbering in metadata, find the lines that contain these characters
         # Find the line number for the start character
-        start_line_num = 1
-        for i, line_start in enumerate(lines):
-            if line_start > start:
-                start_line_num = i  # Previous line contains the start character
-                break
-            start_line_num = i + 1
+        start_line_num = bisect_right(lines, start)
 
         # Find the line number for the end character
-        end_line_num = start_line_num
-        for i in range(start_line_num - 1, len(lines)):
-            if i + 1 < len(lines) and lines[i + 1] > end_char:
-                end_line_num = i + 1
-                break
-            if i + 1 == len(lines):
-                end_line_num = total_lines
+        end_line_num = bisect_right(lines, end_char, start_line_num)
 
         # Create the response metadata
         metadata = {
@@ -267,7 +297,7 @@ def extract_content_by_mode(
             last_page_info = None
 
             for p in range(start, end_page + 1):
-                section_content, position_info = get_page_content(content, lines, page_size, p)
+                section_content, position_info = get_page_content(content, lines, page_size, p, page_spans)
                 all_content.append(section_content)
 
                 if p == start:
@@ -293,7 +323,7 @@ def extract_content_by_mode(
 
         else:
             # Single page case
-            content_to_return, position_info = get_page_content(content, lines, page_size, start)
+            content_to_return, position_info = get_page_content(content, lines, page_size, start, page_spans)
 
             # Create the response metadata
             metadata = {
@@ -307,15 +307,16 @@ class LLMProcess(EventLoopMixin, ProcessForkingMixin):
 
         # Reset file descriptors if not keeping them
         if not keep_file_descriptors and self.file_descriptor_enabled and self.fd_manager:
+            old_fd_manager = self.fd_manager
             # Create a new manager but preserve the settings
             self.fd_manager = FileDescriptorManager(
-                default_page_size=self.fd_manager.default_page_size,
-                max_direct_output_chars=self.fd_manager.max_direct_output_chars,
-                max_input_chars=self.fd_manager.max_input_chars,
-                page_user_input=self.fd_manager.page_user_input,
+                default_page_size=old_fd_manager.default_page_size,
+                max_direct_output_chars=old_fd_manager.max_direct_output_chars,
+                max_input_chars=old_fd_manager.max_input_chars,
+                page_user_input=old_fd_manager.page_user_input,
             )
             # Copy over the FD-related tools registry
-            self.fd_manager.fd_related_tools = self.fd_manager.fd_related_tools.union(self.fd_manager._FD_RELATED_TOOLS)
+            self.fd_manager.fd_related_tools = old_fd_manager.fd_related_tools.copy()
 
     @property
     def tools(self) -> list:
@@ -207,7 +207,7 @@ class LLMProgram(ProgramConfigMixin):
             if not fd_enabled:
                 raise ValueError("Tools 'read_fd' or 'fd_to_file' require file descriptor system, but it's not enabled")
 
-    def _compile_self(self) -> "LLMProgram":
+    def _compile_self(self, visiting: set[int] | None = None) -> "LLMProgram":
         """Compile the program if it hasn't been compiled yet."""
         # Skip if already compiled
         if self.compiled:
@@ -245,7 +245,7 @@ class LLMProgram(ProgramConfigMixin):
         self._validate_tool_dependencies()
 
         # Handle linked programs recursively
-        self._compile_linked_programs()
+        self._compile_linked_programs(visiting)
 
         # Mark as compiled
         self.compiled = True
@@ -276,8 +276,10 @@ class LLMProgram(ProgramConfigMixin):
                 self.file_descriptor["enabled"] = True
             logger.info("FD tools enabled, automatically enabling file descriptor system")
 
-    def _compile_linked_programs(self) -> None:
+    def _compile_linked_programs(self, visiting: set[int] | None = None) -> None:
         """Compile any linked programs."""
+        # Programs still being compiled up the stack are skipped so cyclic links terminate
+        visiting = (visiting or set()) | {id(self)}
         compiled_linked = {}
 
         # Process each linked program
@@ -291,8 +293,8 @@ class LLMProgram(ProgramConfigMixin):
                     warnings.warn(f"Linked program not found: {program_or_path}", stacklevel=2)
             elif isinstance(program_or_path, LLMProgram):
                 # It's already a program instance, compile it if not already compiled
-                if not program_or_path.compiled:
-                    program_or_path._compile_self()
+                if not program_or_path.compiled and id(program_or_path) not in visiting:
+                    program_or_path._compile_self(visiting)
                 compiled_linked[name] = program_or_path
             else:
                 raise ValueError(f"Invalid linked program type for {name}: {type(program_or_path)}")
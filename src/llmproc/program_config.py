@@ -14,6 +14,7 @@ from llmproc.common.access_control import AccessLevel  # noqa: F401 - used for d
 from llmproc.common.metadata import attach_meta, get_tool_meta
 from llmproc.config import EnvInfoConfig
 from llmproc.config.tool import ToolConfig
+from llmproc.providers.anthropic_utils import TOKEN_EFFICIENT_TOOLS_BETA
 from llmproc.tools import ToolManager
 from llmproc.tools.builtin import BUILTIN_TOOLS
 from llmproc.tools.mcp import MCPServerTools
@@ -76,8 +77,9 @@ class ProgramConfigMixin:
         return self
 
     def add_preload_file(self, file_path: str) -> LLMProgram:
-        """Add a file to preload into the system prompt."""
-        self.preload_files.append(file_path)
+        """Add a file to preload into the system prompt, ignoring duplicates."""
+        if file_path not in self.preload_files:
+            self.preload_files.append(file_path)
         return self
 
     def configure_env_info(
@@ -126,7 +128,7 @@ class ProgramConfigMixin:
             self.parameters = {}
         if "extra_headers" not in self.parameters:
             self.parameters["extra_headers"] = {}
-        self.parameters["extra_headers"]["anthropic-beta"] = "token-efficient-tools-2025-02-19"
+        self.parameters["extra_headers"]["anthropic-beta"] = TOKEN_EFFICIENT_TOOLS_BETA
         return self
 
     def register_tools(self, tools: list[str | Callable | MCPServerTools]) -> LLMProgram:
@@ -20,6 +20,9 @@ from llmproc.utils.id_utils import render_id
 
 logger = logging.getLogger(__name__)
 
+# Beta header value that enables token-efficient tool use on Claude 3.7
+TOKEN_EFFICIENT_TOOLS_BETA = "token-efficient-tools-2025-02-19"
+
 
 def is_cacheable_content(content: Any) -> bool:
     """
@@ -224,15 +227,12 @@ def add_token_efficient_header_if_needed(process, extra_headers: dict[str, str]
     )
 
     if is_test_mock:
-        if (
-            "anthropic-beta" in extra_headers
-            and "token-efficient-tools-2025-02-19" not in extra_headers["anthropic-beta"]
-        ):
+        if "anthropic-beta" in extra_headers and TOKEN_EFFICIENT_TOOLS_BETA not in extra_headers["anthropic-beta"]:
             # Append to existing header value
-            extra_headers["anthropic-beta"] = f"{extra_headers['anthropic-beta']},token-efficient-tools-2025-02-19"
+            extra_headers["anthropic-beta"] = f"{extra_headers['anthropic-beta']},{TOKEN_EFFICIENT_TOOLS_BETA}"
         else:
             # Set new header value
-            extra_headers["anthropic-beta"] = "token-efficient-tools-2025-02-19"
+            extra_headers["anthropic-beta"] = TOKEN_EFFICIENT_TOOLS_BETA
         return extra_headers
 
     # For normal operation, check if token-efficient tools should be enabled
@@ -241,16 +241,13 @@ def add_token_efficient_header_if_needed(process, extra_headers: dict[str, str]
     # Check in parameters (if they exist)
     if hasattr(process, "parameters"):
         param_headers = process.parameters.get("extra_headers", {})
-        if (
-            isinstance(param_headers, dict)
-            and param_headers.get("anthropic-beta") == "token-efficient-tools-2025-02-19"
-        ):
+        if isinstance(param_headers, dict) and param_headers.get("anthropic-beta") == TOKEN_EFFICIENT_TOOLS_BETA:
             token_efficient_enabled = True
 
     # Check in api_params as fallback
     if hasattr(process, "api_params"):
         api_headers = process.api_params.get("extra_headers", {})
-        if isinstance(api_headers, dict) and api_headers.get("anthropic-beta") == "token-efficient-tools-2025-02-19":
+        if isinstance(api_headers, dict) and api_headers.get("anthropic-beta") == TOKEN_EFFICIENT_TOOLS_BETA:
             token_efficient_enabled = True
 
     # Apply the header if conditions are met
@@ -262,15 +259,12 @@ def add_token_efficient_header_if_needed(process, extra_headers: dict[str, str]
         and is_claude_37_model(process.model_name)
     ):
         # Add or append to the header
-        if (
-            "anthropic-beta" in extra_headers
-            and "token-efficient-tools-2025-02-19" not in extra_headers["anthropic-beta"]
-        ):
+        if "anthropic-beta" in extra_headers and TOKEN_EFFICIENT_TOOLS_BETA not in extra_headers["anthropic-beta"]:
             # Append to existing header value
-            extra_headers["anthropic-beta"] = f"{extra_headers['anthropic-beta']},token-efficient-tools-2025-02-19"
+            extra_headers["anthropic-beta"] = f"{extra_headers['anthropic-beta']},{TOKEN_EFFICIENT_TOOLS_BETA}"
         else:
             # Set new header value
-            extra_headers["anthropic-beta"] = "token-efficient-tools-2025-02-19"
+            extra_headers["anthropic-beta"] = TOKEN_EFFICIENT_TOOLS_BETA
 
     # Warning if token-efficient tools header is present but not supported
     if (
@@ -380,11 +374,9 @@ def prepare_api_request(process: Any, add_cache: bool = True) -> dict[str, Any]:
     # Start with API parameters
     api_params = process.api_params.copy()
 
-    # Extract extra headers
-    extra_headers = api_params.pop("extra_headers", {}).copy() if "extra_headers" in api_params else {}
-
-    # Add token-efficient tools header if needed
-    extra_headers = add_token_efficient_header_if_needed(process, extra_headers)
+    # Extract extra headers and add the token-efficient tools header if needed
+    # (the helper returns a copy, so the program's parameters are never mutated)
+    extra_headers = add_token_efficient_header_if_needed(process, api_params.pop("extra_headers", None))
 
     # Determine if message ID prefixes should be added
     message_ids_enabled = getattr(process.tool_manager, "message_ids_enabled", False)
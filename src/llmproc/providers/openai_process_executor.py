@@ -67,11 +67,14 @@ class OpenAIProcessExecutor:
         if process.enriched_system_prompt:
             formatted_messages.append({"role": "system", "content": process.enriched_system_prompt})
 
-        # Then add conversation history
-        for message in process.state:
-            # Add user and assistant messages
-            if message["role"] in ["user", "assistant"]:
-                formatted_messages.append({"role": message["role"], "content": message["content"]})
+        # Then add conversation history (user and assistant messages only)
+        formatted_messages.extend(
+            [
+                {"role": message["role"], "content": message["content"]}
+                for message in process.state
+                if message["role"] in ("user", "assistant")
+            ]
+        )
 
         # Create a new RunResult if one wasn't provided
         if run_result is None:
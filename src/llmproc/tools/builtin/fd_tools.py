@@ -5,6 +5,7 @@ These tools handle the ToolResult wrapping around the plain data returned by
 FileDescriptorManager's methods.
 """
 
+import asyncio
 import logging
 from typing import Any, Optional
 
@@ -128,8 +129,14 @@ async def fd_to_file_tool(
     fd_manager = runtime_context["fd_manager"]
 
     try:
-        xml_content = fd_manager.write_fd_to_file_content(
-            fd_id=fd, file_path=file_path, mode=mode, create=create, exist_ok=exist_ok
+        # Run the blocking disk write off the event loop so concurrent tool calls can overlap
+        xml_content = await asyncio.to_thread(
+            fd_manager.write_fd_to_file_content,
+            fd_id=fd,
+            file_path=file_path,
+            mode=mode,
+            create=create,
+            exist_ok=exist_ok,
         )
         # Wrap successful result
         return ToolResult.from_success(xml_content)
@@ -101,24 +101,14 @@ def find_position_by_id(state, message_id):
             return message_id
         return None
 
-    # Handle string IDs (most common case for LLM input)
+    # Handle string IDs (most common case for LLM input): either the "msg_X"
+    # format seen in messages or a direct string integer ("0", "1", etc.)
     if isinstance(message_id, str):
-        # Case 1: LLM uses "msg_X" format as seen in messages
-        if message_id.startswith(MESSAGE_ID_PREFIX):
-            try:
-                idx = int(message_id[len(MESSAGE_ID_PREFIX) :])
-                if 0 <= idx < len(state):
-                    return idx
-            except ValueError:
-                pass
-
-        # Case 2: Direct string integer ("0", "1", etc.)
-        try:
-            idx = int(message_id)
-            if 0 <= idx < len(state):
+        index_text = message_id.removeprefix(MESSAGE_ID_PREFIX)
+        if index_text.isdecimal():
+            idx = int(index_text)
+            if idx < len(state):
                 return idx
-        except ValueError:
-            pass
 
     # Message ID not found
     return None
@@ -169,7 +159,7 @@ async def handle_goto(position: str, message: str, runtime_context: Optional[dic
         "cannot_go_forward": "Cannot go forward in time. Message {} is at or beyond the current point.",
     }
 
-    if not position or not position.startswith("msg_"):
+    if not position or not position.startswith(MESSAGE_ID_PREFIX):
         return ToolResult.from_error(error_messages["invalid_id_format"].format(position))
 
     # Find target position in history by message ID
@@ -183,8 +173,11 @@ async def handle_goto(position: str, message: str, runtime_context: Optional[dic
     if target_index >= len(process.state) - 1:
         return ToolResult.from_error(error_messages["cannot_go_forward"].format(position))
 
+    # Message count before truncation, used for logging, history and the reset note
+    original_message_count = len(process.state)
+
     # Log the operation
-    logger.info(f"GOTO: Resetting conversation from {len(process.state)} messages to {target_index + 1} messages")
+    logger.info(f"GOTO: Resetting conversation from {original_message_count} messages to {target_index + 1} messages")
 
     # Store time travel metadata in process
     if not hasattr(process, "time_travel_history"):
@@ -193,37 +186,35 @@ async def handle_goto(position: str, message: str, runtime_context: Optional[dic
     process.time_travel_history.append(
         {
             "timestamp": datetime.datetime.now().isoformat(),
-            "from_message_count": len(process.state),
+            "from_message_count": original_message_count,
             "to_message_count": target_index + 1,
             "position_reference": position,
         }
     )
 
     # Debug the truncation
-    logger.info(f"Before truncation, state has {len(process.state)} messages")
+    logger.info(f"Before truncation, state has {original_message_count} messages")
     logger.info(f"Will keep messages up to index {target_index}")
 
-    # Truncate history after target
+    # Truncate history after target, in place, so the kept prefix isn't copied
     original_content = process.state[target_index]["content"]
-    process.state = process.state[:target_index]
+    del process.state[target_index:]
 
     logger.info(f"After truncation, state has {len(process.state)} messages")
 
     # Optionally add new message
     if message:
-        # Use the message directly
-        # Calculate the number of messages that were removed (this was before truncation)
-        original_message_count = process.time_travel_history[-1]["from_message_count"]
+        # Calculate the number of messages that were removed
         removed_message_count = original_message_count - (target_index + 1)
 
-        # Format the system note with system_message tags
-        system_note = f"<system_message> GOTO tool used. Conversation reset to message {position}. {removed_message_count} messages were removed. </system_message>"
-        original_message = f"<original_message_to_be_ignored>\n{original_content}\n</original_message_to_be_ignored>"
-        # Format the assistant message with time_travel_message tags
-        formatted_message = f"<time_travel_message>\n{message}\n</time_travel_message>"
-
-        # Combine the system note with the user's message
-        final_message = f"{system_note}\n{original_message}\n{formatted_message}"
+        # Build the system note, the original message and the time travel message
+        # as one f-string so the combined content is assembled in a single pass
+        final_message = (
+            f"<system_message> GOTO tool used. Conversation reset to message {position}. "
+            f"{removed_message_count} messages were removed. </system_message>\n"
+            f"<original_message_to_be_ignored>\n{original_content}\n</original_message_to_be_ignored>\n"
+            f"<time_travel_message>\n{message}\n</time_travel_message>"
+        )
 
         # Use append_message_with_id to ensure it gets a proper ID
         append_message_with_id(process, "user", final_message)
@@ -16,7 +16,10 @@ from pathlib import Path
 import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from conftest import get_example_file_path, get_repo_root
+from conftest import get_examples_dir, get_repo_root
+
+# Resolved once at import; all example programs are looked up relative to it
+EXAMPLES_DIR = Path(get_examples_dir())
 
 
 def api_keys_available():
@@ -39,16 +42,35 @@ def api_keys_available():
 def get_available_program_path():
     """Get a path to an available program based on API keys."""
     if "ANTHROPIC_API_KEY" in os.environ and "None" not in os.environ["ANTHROPIC_API_KEY"]:
-        return Path(get_example_file_path("anthropic.toml"))
+        return EXAMPLES_DIR / "anthropic.toml"
     elif "OPENAI_API_KEY" in os.environ and "None" not in os.environ["OPENAI_API_KEY"]:
-        return Path(get_example_file_path("openai.toml"))
+        return EXAMPLES_DIR / "openai.toml"
     else:
         return None
 
 
+def require_api_keys():
+    """Skip the calling test when no usable API key is set."""
+    if not api_keys_available():
+        pytest.skip("API keys not available for testing")
+
+
+def require_program_path():
+    """Return an example program usable with the available API keys, or skip."""
+    require_api_keys()
+
+    program_path = get_available_program_path()
+    if not program_path:
+        pytest.skip("No API keys available for testing")
+    return program_path
+
+
 def run_cli_command(args, input_text=None, timeout=45):
     """Run the CLI command with specified arguments.
 
+    All CLI invocations in this module go through this helper so every
+    subprocess gets a timeout and a non-raising exit status.
+
     Args:
         args: List of command arguments
         input_text: Optional text to send to stdin
@@ -58,13 +80,18 @@ def run_cli_command(args, input_text=None, timeout=45):
         Tuple of (return_code, stdout, stderr)
     """
     try:
+        # subprocess.run feeds stdin and drains stdout/stderr together via
+        # communicate(), so large CLI responses cannot deadlock on full pipes.
         result = subprocess.run(
             args,
             input=input_text,
+            # Without input, give the child an immediate EOF instead of the parent's stdin
+            stdin=subprocess.DEVNULL if input_text is None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
             timeout=timeout,
+            check=False,
         )
         return result.returncode, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
@@ -131,12 +158,7 @@ def run_exact_command(command, timeout=45):
 @pytest.mark.essential_api
 def test_cli_prompt_option_outputs_marker():
     """Test the --prompt option with an example program."""
-    if not api_keys_available():
-        pytest.skip("API keys not available for testing")
-
-    program_path = get_available_program_path()
-    if not program_path:
-        pytest.skip("No API keys available for testing")
+    program_path = require_program_path()
 
     # Create a unique test marker
     unique_marker = f"UNIQUE_TEST_MARKER_{Path(program_path).stem.upper()}"
@@ -156,12 +178,7 @@ def test_cli_prompt_option_outputs_marker():
 @pytest.mark.essential_api
 def test_cli_reads_stdin():
     """Test piping input to the non-interactive CLI."""
-    if not api_keys_available():
-        pytest.skip("API keys not available for testing")
-
-    program_path = get_available_program_path()
-    if not program_path:
-        pytest.skip("No API keys available for testing")
+    program_path = require_program_path()
 
     # Run CLI with stdin input
     return_code, stdout, stderr = run_non_interactive_option(program_path)
@@ -178,12 +195,7 @@ def test_cli_reads_stdin():
 @pytest.mark.essential_api
 def test_complex_prompt_with_quotes():
     """Test a complex prompt with quotes in it."""
-    if not api_keys_available():
-        pytest.skip("API keys not available for testing")
-
-    program_path = get_available_program_path()
-    if not program_path:
-        pytest.skip("No API keys available for testing")
+    program_path = require_program_path()
 
     # Use direct list of arguments to properly handle complex quoting
     cmd = [
@@ -212,12 +224,7 @@ def test_complex_prompt_with_quotes():
 @pytest.mark.essential_api
 def test_stdin_pipe_with_stdin():
     """Test piping input to the CLI."""
-    if not api_keys_available():
-        pytest.skip("API keys not available for testing")
-
-    program_path = get_available_program_path()
-    if not program_path:
-        pytest.skip("No API keys available for testing")
+    program_path = require_program_path()
 
     # Create command for piping input
     cmd = [
@@ -246,12 +253,7 @@ def test_stdin_pipe_with_stdin():
 @pytest.mark.extended_api
 def test_tool_usage():
     """Test that tools work correctly through CLI."""
-    if not api_keys_available():
-        pytest.skip("API keys not available for testing")
-
-    program_path = get_available_program_path()
-    if not program_path:
-        pytest.skip("No API keys available for testing")
+    program_path = require_program_path()
 
     # Simple prompt that should use calculator tool
     prompt = "What is 2+2?"
@@ -270,11 +272,10 @@ def test_tool_usage():
 @pytest.mark.release_api
 def test_program_linking():
     """Test program linking through CLI."""
-    if not api_keys_available():
-        pytest.skip("API keys not available for testing")
+    require_api_keys()
 
     # Test with program-linking/main.toml
-    program_path = Path(get_example_file_path("program-linking/main.toml"))
+    program_path = EXAMPLES_DIR / "program-linking" / "main.toml"
 
     # Prompt that should trigger the spawn tool
     prompt = "Ask the repo expert what files are in src/llmproc"
@@ -326,12 +327,7 @@ def test_cli_handles_invalid_program():
 @pytest.mark.essential_api
 def test_empty_prompt_error():
     """Test that empty prompts cause appropriate error message and exit code."""
-    if not api_keys_available():
-        pytest.skip("API keys not available for testing")
-
-    program_path = get_available_program_path()
-    if not program_path:
-        pytest.skip("No API keys available for testing")
+    program_path = require_program_path()
 
     # Run CLI with empty prompt
     return_code, stdout, stderr = run_prompt_option(program_path, "")
@@ -2,6 +2,7 @@
 
 import os
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -53,6 +54,35 @@ def get_test_data_path(relative_path: str) -> str:
     return os.path.join(get_test_dir(), "data", relative_path)
 
 
+def extract_between(text: str, start: str, end: str) -> str:
+    """Return the text between the first ``start`` and the following ``end``.
+
+    Used to pull attribute values such as ``fd="..."`` out of XML tool results.
+
+    Args:
+        text: The text to search
+        start: Delimiter preceding the wanted value
+        end: Delimiter following the wanted value
+
+    Returns:
+        The text between the delimiters, or an empty string if ``start`` is absent
+    """
+    _, _, tail = text.partition(start)
+    value, _, _ = tail.partition(end)
+    return value
+
+
+def assert_all_in(text: str, needles: tuple[str, ...]) -> None:
+    """Assert that every needle occurs in ``text``, reporting all missing ones at once.
+
+    Args:
+        text: The text to search
+        needles: Substrings that must all be present
+    """
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"Missing {missing} in: {text}"
+
+
 def pytest_addoption(parser):
     """Add pytest command line options."""
     parser.addoption(
@@ -104,6 +134,13 @@ def vertex_project_id():
     return os.environ.get("ANTHROPIC_VERTEX_PROJECT_ID")
 
 
+@pytest.fixture
+def mock_env(monkeypatch):
+    """Mock API credential environment variables."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-anthropic-key")
+    monkeypatch.setenv("GITHUB_TOKEN", "test-github-token")
+
+
 @pytest.fixture
 def standard_system_prompt():
     """Return a standard system prompt for testing."""
@@ -113,14 +150,15 @@ def standard_system_prompt():
 def create_mock_llm_program(enabled_tools=None):
     """Create a mock LLMProgram for testing.
 
+    Each call returns a fresh mock; callers such as the spawn tests build
+    separate parent and child programs and mutate them independently.
+
     Args:
         enabled_tools: Optional list of tools to enable
 
     Returns:
         Mock: A mocked LLMProgram instance
     """
-    from unittest.mock import AsyncMock, MagicMock, patch
-
     # Create a mock program
     program = MagicMock()
 
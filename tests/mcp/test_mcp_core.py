@@ -7,15 +7,23 @@ This file consolidates core MCP tests from:
 """
 
 import json
-import os
 import sys
-from tempfile import NamedTemporaryFile
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from llmproc.common.access_control import AccessLevel
 from llmproc.common.results import ToolResult
+from llmproc.config.mcp import MCPToolsConfig
+from llmproc.config.program_loader import ProgramLoader
+from llmproc.config.schema import (
+    LLMProgramConfig,
+    MCPConfig,
+    ModelConfig,
+    PromptConfig,
+    ToolsConfig,
+)
+from llmproc.config.tool import ToolConfig
 from llmproc.program import LLMProgram
 from llmproc.tools.mcp import MCPServerTools
 from llmproc.tools.mcp.constants import MCP_TOOL_SEPARATOR
@@ -25,22 +33,12 @@ from tests.conftest import create_test_llmprocess_directly
 
 
 # Common fixtures
-@pytest.fixture
-def mock_env():
-    """Mock environment variables."""
-    original_env = os.environ.copy()
-    os.environ["ANTHROPIC_API_KEY"] = "test-anthropic-key"
-    os.environ["GITHUB_TOKEN"] = "test-github-token"
-    yield
-    os.environ.clear()
-    os.environ.update(original_env)
-
-
-@pytest.fixture
-def time_mcp_config():
-    """Create a temporary MCP config file with time server."""
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_file:
-        json.dump(
+@pytest.fixture(scope="session")
+def time_mcp_config(tmp_path_factory):
+    """Create an MCP config file with time server, written once per session."""
+    config_path = tmp_path_factory.mktemp("mcp") / "time_servers.json"
+    config_path.write_text(
+        json.dumps(
             {
                 "mcpServers": {
                     "time": {
@@ -49,31 +47,30 @@ def time_mcp_config():
                         "args": ["mcp-server-time"],
                     }
                 }
-            },
-            temp_file,
+            }
         )
-        temp_path = temp_file.name
-
-    yield temp_path
-    os.unlink(temp_path)
-
-
-@pytest.fixture
-def mock_time_response():
-    """Mock response for the time tool."""
+    )
+    return str(config_path)
 
-    class ToolResponse:
-        def __init__(self, time_data):
-            self.content = time_data
-            self.isError = False
 
-    return ToolResponse(
-        {
-            "unix_timestamp": 1646870400,
-            "utc_time": "2022-03-10T00:00:00Z",
-            "timezone": "UTC",
-        }
+@pytest.fixture(scope="session")
+def test_server_mcp_config(tmp_path_factory):
+    """Create an MCP config file with a mock test server, written once per session."""
+    config_path = tmp_path_factory.mktemp("mcp") / "test_servers.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "test-server": {
+                        "type": "stdio",
+                        "command": "echo",
+                        "args": ["mock"],
+                    }
+                }
+            }
+        )
     )
+    return str(config_path)
 
 
 # Reusable utility functions
@@ -132,101 +129,61 @@ async def test_manager_initialization(time_mcp_config):
 
 
 @pytest.mark.asyncio
-async def test_manager_with_mocked_registry():
+async def test_manager_with_mocked_registry(test_server_mcp_config):
     """Test MCPManager with properly mocked registry."""
-    # Setup - Create MCPManager with test configuration
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-        json.dump(
-            {
-                "mcpServers": {
-                    "test-server": {
-                        "type": "stdio",
-                        "command": "echo",
-                        "args": ["mock"],
-                    }
-                }
-            },
-            tmp,
+    # Create registry and manager for testing
+    registry = ToolRegistry()
+    registry.tool_manager = MagicMock()
+    registry.tool_manager.enabled_tools = []
+
+    # Setup standard mocks with time server
+    mock_server_registry, mock_server_instance, mock_aggregator_class = mock_mcp_registry()
+
+    # Test with properly mocked registry
+    # Use patch.object to intercept method calls
+    with (
+        patch("llmproc.mcp_registry.ServerRegistry.from_config", return_value=mock_server_instance),
+        patch("llmproc.mcp_registry.MCPAggregator", mock_aggregator_class),
+    ):
+        # Create a fresh manager for each test for clean state
+        manager = MCPManager(
+            config_path=test_server_mcp_config,
+            mcp_tools=[MCPServerTools(server="test-server", tools=["test-tool"])],
+            provider="anthropic",
         )
-        config_path = tmp.name
-
-    try:
-        # Create registry and manager for testing
-        registry = ToolRegistry()
-        registry.tool_manager = MagicMock()
-        registry.tool_manager.enabled_tools = []
-
-        # Setup standard mocks with time server
-        mock_server_registry, mock_server_instance, mock_aggregator_class = mock_mcp_registry()
-
-        # Test with properly mocked registry
-        # Use patch.object to intercept method calls
-        with (
-            patch("llmproc.mcp_registry.ServerRegistry.from_config", return_value=mock_server_instance),
-            patch("llmproc.mcp_registry.MCPAggregator", mock_aggregator_class),
-        ):
-            # Create a fresh manager for each test for clean state
-            manager = MCPManager(
-                config_path=config_path,
-                mcp_tools=[MCPServerTools(server="test-server", tools=["test-tool"])],
-                provider="anthropic",
-            )
-
-            success = await manager.initialize(registry)
-            assert success is True
-            assert manager.initialized is True
-            assert len(registry.tool_handlers) == 0  # No mocked tools were registered
-
-            # Ensure server filtering was performed
-            mock_server_instance.filter_servers.assert_called_once_with(["test-server"])
-            mock_aggregator_class.assert_called_once_with(mock_server_instance.filter_servers.return_value)
-
-    finally:
-        os.unlink(config_path)
+
+        success = await manager.initialize(registry)
+        assert success is True
+        assert manager.initialized is True
+        assert len(registry.tool_handlers) == 0  # No mocked tools were registered
+
+        # Ensure server filtering was performed
+        mock_server_instance.filter_servers.assert_called_once_with(["test-server"])
+        mock_aggregator_class.assert_called_once_with(mock_server_instance.filter_servers.return_value)
 
 
 @pytest.mark.asyncio
-async def test_manager_validation():
+async def test_manager_validation(test_server_mcp_config):
     """Test MCPManager validation and configuration checks."""
-    # Create temporary config for testing
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-        json.dump(
-            {
-                "mcpServers": {
-                    "test-server": {
-                        "type": "stdio",
-                        "command": "echo",
-                        "args": ["mock"],
-                    }
-                }
-            },
-            tmp,
-        )
-        config_path = tmp.name
+    # Test missing config path
+    manager = MCPManager(config_path=None)
 
-    try:
-        # Test missing config path
-        manager = MCPManager(config_path=None)
+    # Check validation methods
+    assert manager.is_enabled() is False
+    assert manager.is_valid_configuration() is False
 
-        # Check validation methods
-        assert manager.is_enabled() is False
-        assert manager.is_valid_configuration() is False
-
-        # Test valid configuration
-        manager = MCPManager(config_path=config_path, mcp_tools=[MCPServerTools(server="test-server", tools=["tool"])])
+    # Test valid configuration
+    manager = MCPManager(
+        config_path=test_server_mcp_config, mcp_tools=[MCPServerTools(server="test-server", tools=["tool"])]
+    )
 
-        # Check validation methods
-        assert manager.is_enabled() is True
-        assert manager.is_valid_configuration() is True
-    finally:
-        os.unlink(config_path)
+    # Check validation methods
+    assert manager.is_enabled() is True
+    assert manager.is_valid_configuration() is True
 
 
 def test_mcptoolsconfig_build_tools():
     """Test direct conversion from MCPToolsConfig to MCPServerTools."""
-    from llmproc.config.mcp import MCPServerTools, MCPToolsConfig
-    from llmproc.config.tool import ToolConfig
-
     # Create config with tool items
     config = MCPToolsConfig(root={"calc": [ToolConfig(name="add", access="read"), ToolConfig(name="sub")]})
 
@@ -250,17 +207,6 @@ def test_mcptoolsconfig_build_tools():
 
 def test_program_loader_with_item_list(tmp_path):
     """ProgramLoader builds MCPServerTools objects from item lists."""
-    from llmproc.config.mcp import MCPToolsConfig
-    from llmproc.config.tool import ToolConfig
-    from llmproc.config.program_loader import ProgramLoader
-    from llmproc.config.schema import (
-        LLMProgramConfig,
-        MCPConfig,
-        ModelConfig,
-        PromptConfig,
-        ToolsConfig,
-    )
-
     mcp_json = tmp_path / "config.json"
     mcp_json.write_text("{}")
 
@@ -6,9 +6,6 @@ descriptor approach.
 """
 
 import json
-import os
-import tempfile
-from tempfile import NamedTemporaryFile
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -56,22 +53,12 @@ def test_mcptool_descriptor_validation():
 
 
 # Common fixtures
-@pytest.fixture
-def mock_env():
-    """Mock environment variables."""
-    original_env = os.environ.copy()
-    os.environ["ANTHROPIC_API_KEY"] = "test-anthropic-key"
-    os.environ["GITHUB_TOKEN"] = "test-github-token"
-    yield
-    os.environ.clear()
-    os.environ.update(original_env)
-
-
-@pytest.fixture
-def time_mcp_config():
-    """Create a temporary MCP config file with time server."""
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_file:
-        json.dump(
+@pytest.fixture(scope="session")
+def time_mcp_config(tmp_path_factory):
+    """Create an MCP config file with time server, written once per session."""
+    config_path = tmp_path_factory.mktemp("mcp") / "time_servers.json"
+    config_path.write_text(
+        json.dumps(
             {
                 "mcpServers": {
                     "time": {
@@ -80,18 +67,33 @@ def time_mcp_config():
                         "args": ["mock"],
                     }
                 }
-            },
-            temp_file,
+            }
         )
-        config_path = temp_file.name
-    yield config_path
-    os.unlink(config_path)
+    )
+    return str(config_path)
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("mcp_tools", "expected_tools"),
+    [
+        pytest.param([MCPServerTools(server="time", tools=["current"])], {"time": ["current"]}, id="listed_tools"),
+        pytest.param([MCPServerTools(server="time")], {"time": "all"}, id="all_tools"),
+        pytest.param(
+            [
+                MCPServerTools(server="time", tools=["current"]),
+                MCPServerTools(server="calculator", tools=["add", "subtract"]),
+            ],
+            {"time": ["current"], "calculator": ["add", "subtract"]},
+            id="multiple_servers",
+        ),
+    ],
+)
 @patch("llmproc.providers.providers.AsyncAnthropic")
 @patch("llmproc.tools.mcp.manager.MCPManager.initialize")
-async def test_mcptool_descriptors(mock_initialize, mock_anthropic, mock_env, time_mcp_config):
+async def test_mcptool_descriptors(
+    mock_initialize, mock_anthropic, mock_env, time_mcp_config, mcp_tools, expected_tools
+):
     """Test program configuration with ``MCPServerTools`` descriptors."""
     # Setup mocks
     mock_client = MagicMock()
@@ -104,50 +106,17 @@ async def test_mcptool_descriptors(mock_initialize, mock_anthropic, mock_env, ti
         provider="anthropic",
         system_prompt="You are an assistant with access to tools.",
         mcp_config_path=time_mcp_config,
-        tools=[MCPServerTools(server="time", tools=["current"])],  # Using MCPServerTools descriptor
+        tools=mcp_tools,
     )
 
-    # Verify that the MCPServerTools descriptor was stored in the tool_manager
-    assert len(program.tool_manager.mcp_tools) == 1
-    assert program.tool_manager.mcp_tools[0].server == "time"
-    assert program.tool_manager.mcp_tools[0].tools == ["current"]
+    # Verify that the MCPServerTools descriptors were stored in the tool_manager
+    assert {d.server: d.tools for d in program.tool_manager.mcp_tools} == expected_tools
 
     # Create a process
     process = await program.start()
 
     # Verify the MCPManager is initialized with the config path
     assert process.tool_manager.mcp_manager.config_path == time_mcp_config
-    assert process.tool_manager.mcp_manager.config_path == time_mcp_config
 
     # Verify initialize was called
     mock_initialize.assert_called_once()
-
-    # Test with 'all' tools
-    program2 = LLMProgram(
-        model_name="claude-3-5-sonnet",
-        provider="anthropic",
-        system_prompt="You are an assistant with access to tools.",
-        mcp_config_path=time_mcp_config,
-        tools=[MCPServerTools(server="time")],  # Using MCPServerTools descriptor with "all" tools
-    )
-
-    # Verify the descriptor was stored correctly with "all"
-    assert len(program2.tool_manager.mcp_tools) == 1
-    assert program2.tool_manager.mcp_tools[0].server == "time"
-    assert program2.tool_manager.mcp_tools[0].tools == "all"
-
-    # Test with multiple MCPServerTools descriptors
-    program3 = LLMProgram(
-        model_name="claude-3-5-sonnet",
-        provider="anthropic",
-        system_prompt="You are an assistant with access to tools.",
-        mcp_config_path=time_mcp_config,
-        tools=[
-            MCPServerTools(server="time", tools=["current"]),
-            MCPServerTools(server="calculator", tools=["add", "subtract"]),
-        ],
-    )
-
-    # Verify multiple descriptors are stored correctly
-    assert len(program3.tool_manager.mcp_tools) == 2
-    assert {d.server for d in program3.tool_manager.mcp_tools} == {"time", "calculator"}
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from llmproc.providers.anthropic_utils import (
+    TOKEN_EFFICIENT_TOOLS_BETA,
     add_token_efficient_header_if_needed,
 )
 from llmproc.providers.constants import ANTHROPIC_PROVIDERS
@@ -24,7 +25,7 @@ class TestAnthropicHelperFunctions:
         result = add_token_efficient_header_if_needed(process, headers)
 
         assert "anthropic-beta" in result
-        assert result["anthropic-beta"] == "token-efficient-tools-2025-02-19"
+        assert result["anthropic-beta"] == TOKEN_EFFICIENT_TOOLS_BETA
 
     def test_add_token_efficient_header_existing_headers(self):
         """Test adding token-efficient header to existing headers."""
@@ -36,7 +37,7 @@ class TestAnthropicHelperFunctions:
         result = add_token_efficient_header_if_needed(process, headers)
 
         assert "anthropic-beta" in result
-        assert "existing-feature,token-efficient-tools-2025-02-19" == result["anthropic-beta"]
+        assert f"existing-feature,{TOKEN_EFFICIENT_TOOLS_BETA}" == result["anthropic-beta"]
 
     def test_add_token_efficient_header_already_present(self):
         """Test not duplicating token-efficient header if already present."""
@@ -44,11 +45,11 @@ class TestAnthropicHelperFunctions:
         process.provider = "anthropic"
         process.model_name = "claude-3-7-sonnet-20250219"
 
-        headers = {"anthropic-beta": "token-efficient-tools-2025-02-19"}
+        headers = {"anthropic-beta": TOKEN_EFFICIENT_TOOLS_BETA}
         result = add_token_efficient_header_if_needed(process, headers)
 
         assert "anthropic-beta" in result
-        assert result["anthropic-beta"] == "token-efficient-tools-2025-02-19"
+        assert result["anthropic-beta"] == TOKEN_EFFICIENT_TOOLS_BETA
 
     def test_add_token_efficient_header_non_claude_37(self):
         """Test that header is not added for non-Claude 3.7 models."""
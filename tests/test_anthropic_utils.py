@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from llmproc.common.constants import LLMPROC_MSG_ID
 from llmproc.providers.anthropic_utils import (
+    TOKEN_EFFICIENT_TOOLS_BETA,
     add_message_ids,
     add_token_efficient_header_if_needed,
     apply_cache_control,
@@ -165,6 +166,23 @@ class TestAPIFormatting:
         # Check tools are included
         assert request["tools"] == process.tools
 
+    def test_prepare_api_request_keeps_configured_headers(self):
+        """Test that prepare_api_request adds beta headers without mutating the configured ones."""
+        headers = {"anthropic-beta": "other-beta"}
+        process = MagicMock()
+        process.state = [{"role": "user", "content": "Hello"}]
+        process.enriched_system_prompt = "You are Claude"
+        process.tools = []
+        process.model_name = "claude-3-7-sonnet-20250219"
+        process.provider = "anthropic"
+        process.api_params = {"extra_headers": headers}
+        process.disable_automatic_caching = False
+
+        request = prepare_api_request(process)
+
+        assert request["extra_headers"]["anthropic-beta"] == f"other-beta,{TOKEN_EFFICIENT_TOOLS_BETA}"
+        assert headers == {"anthropic-beta": "other-beta"}
+
 
 class TestTokenEfficientHeaders:
     """Tests for token efficient headers functions."""
@@ -179,7 +197,7 @@ class TestTokenEfficientHeaders:
         result = add_token_efficient_header_if_needed(process, headers)
 
         assert "anthropic-beta" in result
-        assert result["anthropic-beta"] == "token-efficient-tools-2025-02-19"
+        assert result["anthropic-beta"] == TOKEN_EFFICIENT_TOOLS_BETA
 
     def test_add_token_efficient_header_existing_headers(self):
         """Test adding token-efficient header to existing headers."""
@@ -191,7 +209,7 @@ class TestTokenEfficientHeaders:
         result = add_token_efficient_header_if_needed(process, headers)
 
         assert "anthropic-beta" in result
-        assert "existing-feature,token-efficient-tools-2025-02-19" == result["anthropic-beta"]
+        assert f"existing-feature,{TOKEN_EFFICIENT_TOOLS_BETA}" == result["anthropic-beta"]
 
     def test_add_token_efficient_header_already_present(self):
         """Test not duplicating token-efficient header if already present."""
@@ -199,11 +217,11 @@ class TestTokenEfficientHeaders:
         process.provider = "anthropic"
         process.model_name = "claude-3-7-sonnet-20250219"
 
-        headers = {"anthropic-beta": "token-efficient-tools-2025-02-19"}
+        headers = {"anthropic-beta": TOKEN_EFFICIENT_TOOLS_BETA}
         result = add_token_efficient_header_if_needed(process, headers)
 
         assert "anthropic-beta" in result
-        assert result["anthropic-beta"] == "token-efficient-tools-2025-02-19"
+        assert result["anthropic-beta"] == TOKEN_EFFICIENT_TOOLS_BETA
 
     def test_add_token_efficient_header_non_claude_37(self):
         """Test that header is not added for non-Claude 3.7 models."""
@@ -57,10 +57,7 @@ async def test_spawn_tool_transfers_fd_to_child(mock_create_process, mock_get_pr
 
     # Create a file descriptor with test content
     test_content = "This is test content for FD sharing via spawn"
-    fd_xml = parent_process.fd_manager.create_fd_content(test_content)
-    # For test assertions, wrap in ToolResult
-    fd_result = ToolResult(content=fd_xml, is_error=False)
-    fd_id = fd_result.content.split('fd="')[1].split('"')[0]
+    fd_id, _ = parent_process.fd_manager.create_fd(test_content)
 
     # Verify FD was created
     assert fd_id == "fd:1"
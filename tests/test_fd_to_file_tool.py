@@ -1,141 +1,120 @@
 """Tests for the fd_to_file tool."""
 
-import os
-import tempfile
-from unittest.mock import Mock, patch
+import asyncio
 
 import pytest
-from llmproc.common.results import ToolResult
 from llmproc.file_descriptors import FileDescriptorManager
-from llmproc.llm_process import LLMProcess
-from llmproc.program import LLMProgram
 from llmproc.tools.builtin.fd_tools import fd_to_file_tool
 
-from tests.conftest import create_test_llmprocess_directly
+TEST_CONTENT = "This is test content for fd_to_file tool"
 
 
-@pytest.mark.asyncio
-async def test_fd_to_file_tool(mocked_llm_process):
-    """Test the fd_to_file tool.
+@pytest.fixture
+def fd_manager_with_content():
+    """Provide a manager holding one FD with TEST_CONTENT.
 
-    Args:
-        mocked_llm_process: Fixture providing a mocked process instance
+    Returns:
+        Tuple of (fd_manager, fd_id)
     """
-    # Use the mocked process provided by the fixture
-    process = mocked_llm_process
+    fd_manager = FileDescriptorManager()
+    fd_id, _ = fd_manager.create_fd(TEST_CONTENT)
+    return fd_manager, fd_id
 
-    # Enable file descriptors for this test
-    process.file_descriptor_enabled = True
-    process.fd_manager = FileDescriptorManager()
 
-    # Create a file descriptor with content
-    test_content = "This is test content for fd_to_file tool"
-    fd_xml = process.fd_manager.create_fd_content(test_content)
-    # For testing compatibility, wrap in ToolResult
-    fd_result = ToolResult(content=fd_xml, is_error=False)
-    fd_id = fd_result.content.split('fd="')[1].split('"')[0]
+@pytest.mark.asyncio
+async def test_fd_to_file_tool(fd_manager_with_content, tmp_path):
+    """Test the fd_to_file tool.
 
-    # Create temporary file path
-    with tempfile.NamedTemporaryFile(delete=True) as tmp:
-        tmp_path = tmp.name
+    Args:
+        fd_manager_with_content: Manager and FD id
+        tmp_path: Temporary directory for the output file
+    """
+    fd_manager, fd_id = fd_manager_with_content
+    output_path = tmp_path / "output.txt"
 
     # Call the tool with runtime_context
     result = await fd_to_file_tool(
         fd=fd_id,
-        file_path=tmp_path,
-        runtime_context={"fd_manager": process.fd_manager},
+        file_path=str(output_path),
+        runtime_context={"fd_manager": fd_manager},
     )
 
-    try:
-        # Check result
-        assert not result.is_error
-        assert fd_id in result.content
-        assert tmp_path in result.content
+    # Check result
+    assert not result.is_error
+    assert fd_id in result.content
+    assert str(output_path) in result.content
 
-        # Verify file was created with correct content
-        assert os.path.exists(tmp_path)
-        with open(tmp_path) as f:
-            content = f.read()
-        assert content == test_content
-    finally:
-        # Clean up
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+    # Verify file was created with correct content
+    assert output_path.read_bytes() == TEST_CONTENT.encode("utf-8")
 
 
 @pytest.mark.asyncio
-async def test_fd_to_file_invalid_fd(mocked_llm_process):
-    """Test fd_to_file with an invalid file descriptor.
+async def test_fd_to_file_large_multibyte_content(tmp_path):
+    """Test that content spanning several write chunks round-trips exactly."""
+    fd_manager = FileDescriptorManager()
+    content = "Test content ünïcödé ✓\n" * 20000  # well over one write chunk
+    fd_id, _ = fd_manager.create_fd(content)
+    output_path = tmp_path / "large.txt"
 
-    Args:
-        mocked_llm_process: Fixture providing a mocked process instance
-    """
-    # Use the mocked process provided by the fixture
-    process = mocked_llm_process
+    result = await fd_to_file_tool(fd=fd_id, file_path=str(output_path), runtime_context={"fd_manager": fd_manager})
 
-    # Enable file descriptors for this test
-    process.file_descriptor_enabled = True
-    process.fd_manager = FileDescriptorManager()
+    assert not result.is_error
+    assert output_path.read_text(encoding="utf-8") == content
 
-    # Create temporary file path
-    with tempfile.NamedTemporaryFile(delete=True) as tmp:
-        tmp_path = tmp.name
 
-    # Call the tool with invalid FD and runtime_context
-    result = await fd_to_file_tool(
-        fd="fd:999",
-        file_path=tmp_path,
-        runtime_context={"fd_manager": process.fd_manager},
+@pytest.mark.asyncio
+async def test_fd_to_file_concurrent_writes(tmp_path):
+    """Test that several fd_to_file calls can run concurrently."""
+    fd_manager = FileDescriptorManager()
+    contents = [f"Content for file {i}\n" * 50 for i in range(4)]
+    fd_ids = [fd_manager.create_fd(content)[0] for content in contents]
+    paths = [tmp_path / f"out_{i}.txt" for i in range(4)]
+
+    results = await asyncio.gather(
+        *(
+            fd_to_file_tool(fd=fd_id, file_path=str(path), runtime_context={"fd_manager": fd_manager})
+            for fd_id, path in zip(fd_ids, paths)
+        )
     )
 
-    # Check result
-    assert result.is_error
-    assert "not found" in result.content
+    assert not any(result.is_error for result in results)
+    for path, content in zip(paths, contents):
+        assert path.read_text() == content
 
 
 @pytest.mark.asyncio
-async def test_fd_to_file_invalid_path(mocked_llm_process):
-    """Test fd_to_file with an invalid file path.
+@pytest.mark.parametrize(
+    ("fd", "file_path", "with_runtime_context", "expected_error"),
+    [
+        pytest.param("fd:999", "output.txt", True, "not found", id="invalid_fd"),
+        pytest.param(None, "not_a_dir/file.txt", True, "error writing file descriptor", id="invalid_path"),
+        pytest.param(None, "test.txt", False, "runtime context", id="no_runtime_context"),
+    ],
+)
+async def test_fd_to_file_invalid_inputs(
+    fd_manager_with_content, tmp_path, fd, file_path, with_runtime_context, expected_error
+):
+    """Test fd_to_file error results for an unknown FD, an unwritable path, and a missing runtime context.
 
     Args:
-        mocked_llm_process: Fixture providing a mocked process instance
+        fd_manager_with_content: Manager and FD id
+        tmp_path: Temporary directory the destination path is resolved against
+        fd: File descriptor ID to write, or None for the fixture's FD
+        file_path: Destination path relative to tmp_path
+        with_runtime_context: Whether to pass a runtime context holding the FD manager
+        expected_error: Lowercase text expected in the error message
     """
-    # Use the mocked process provided by the fixture
-    process = mocked_llm_process
-
-    # Enable file descriptors for this test
-    process.file_descriptor_enabled = True
-    process.fd_manager = FileDescriptorManager()
-
-    # Create a file descriptor with content
-    test_content = "This is test content for fd_to_file tool"
-    fd_xml = process.fd_manager.create_fd_content(test_content)
-    # For testing compatibility, wrap in ToolResult
-    fd_result = ToolResult(content=fd_xml, is_error=False)
-    fd_id = fd_result.content.split('fd="')[1].split('"')[0]
-
-    # Use an invalid path that should fail
-    invalid_path = "/nonexistent/directory/file.txt"
-
-    # Patch open to force a permission error
-    with patch("builtins.open", side_effect=PermissionError("no permission")):
-        result = await fd_to_file_tool(
-            fd=fd_id,
-            file_path=invalid_path,
-            runtime_context={"fd_manager": process.fd_manager},
-        )
+    fd_manager, fd_id = fd_manager_with_content
+    fd = fd or fd_id
+    runtime_context = {"fd_manager": fd_manager} if with_runtime_context else None
 
-    # Check result
-    assert result.is_error
-    assert "Error writing file descriptor" in result.content
+    # A regular file where a parent directory is expected makes the write itself fail
+    (tmp_path / "not_a_dir").write_text("")
+    output_path = tmp_path / file_path
 
-
-@pytest.mark.asyncio
-async def test_fd_to_file_no_process():
-    """Test fd_to_file without a valid process."""
-    # Call the tool without runtime_context
-    result = await fd_to_file_tool(fd="fd:1", file_path="test.txt", runtime_context=None)
+    result = await fd_to_file_tool(fd=fd, file_path=str(output_path), runtime_context=runtime_context)
 
     # Check result
     assert result.is_error
-    assert "runtime context" in result.content.lower()
+    assert expected_error in result.content.lower()
+    assert not output_path.exists()
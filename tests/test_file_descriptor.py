@@ -6,7 +6,7 @@ import pytest
 
 from llmproc.common.access_control import AccessLevel
 from llmproc.common.results import ToolResult
-from llmproc.file_descriptors import FileDescriptorManager
+from llmproc.file_descriptors import FD_RELATED_TOOLS, FileDescriptorManager
 from llmproc.llm_process import LLMProcess
 from llmproc.program import LLMProgram
 from llmproc.tools.builtin.fd_tools import read_fd_tool
@@ -91,8 +91,7 @@ class TestFileDescriptorManager:
         content1 = "\n".join([f"Line {i}" for i in range(1, 101)])
         manager.default_page_size = 100  # Force pagination
 
-        xml1 = manager.create_fd_content(content1)
-        fd_id1 = xml1.split('fd="')[1].split('"')[0]
+        fd_id1, _ = manager.create_fd(content1)
 
         # Read pages and verify content
         page1 = ToolResult(content=manager.read_fd_content(fd_id1, mode="page", start=1))
@@ -112,8 +111,7 @@ class TestFileDescriptorManager:
         )
         manager.default_page_size = 30  # Force pagination in middle of long line
 
-        xml2 = manager.create_fd_content(content2)
-        fd_id2 = xml2.split('fd="')[1].split('"')[0]
+        fd_id2, _ = manager.create_fd(content2)
 
         # Verify pagination flags
         page1_result = ToolResult(content=manager.read_fd_content(fd_id2, mode="page", start=1))
@@ -135,8 +133,7 @@ class TestFileDescriptorManager:
             assert "fd:999 not found" in str(e)
         # Create an FD
         content = "Test content"
-        xml = manager.create_fd_content(content)
-        fd_id = xml.split('fd="')[1].split('"')[0]
+        fd_id, _ = manager.create_fd(content)
         # Try to read invalid page
         try:
             manager.read_fd_content(fd_id, mode="page", start=999)
@@ -186,8 +183,7 @@ async def test_fd_integration_with_fork(mock_get_provider_client):
     process.file_descriptor_enabled = True
     process.fd_manager = FileDescriptorManager(enable_references=True)
     # Create a file descriptor
-    xml = process.fd_manager.create_fd_content("Test content")
-    fd_id = xml.split('fd="')[1].split('"')[0]
+    fd_id, _ = process.fd_manager.create_fd("Test content")
     # Check that FD exists
     assert fd_id in process.fd_manager.file_descriptors
     # Create a mock forked process that will be returned by create_process
@@ -219,6 +215,22 @@ async def test_fd_integration_with_fork(mock_get_provider_client):
     assert forked_process.access_level == AccessLevel.WRITE
 
 
+def test_reset_state_without_file_descriptors_keeps_fd_tools():
+    """Test that dropping FDs on reset keeps the manager settings and registered FD tools."""
+    program = create_mock_llm_program(enabled_tools=["read_fd"])
+    process = create_test_llmprocess_directly(program=program)
+    process.file_descriptor_enabled = True
+    process.fd_manager = FileDescriptorManager(max_direct_output_chars=10)
+    process.fd_manager.register_fd_tool("custom_fd_tool")
+    fd_id, _ = process.fd_manager.create_fd("Test content")
+
+    process.reset_state(keep_file_descriptors=False)
+
+    assert fd_id not in process.fd_manager.file_descriptors
+    assert process.fd_manager.max_direct_output_chars == 10
+    assert process.fd_manager.is_fd_related_tool("custom_fd_tool")
+
+
 @pytest.mark.asyncio
 @patch("llmproc.providers.anthropic_process_executor.AnthropicProcessExecutor")
 async def test_large_output_wrapping(mock_executor):
@@ -266,12 +278,12 @@ def test_calculate_total_pages_and_fd_tools():
 
     # Test 1: Page calculation for different content sizes
     # Small content - single page
-    small_fd_id = manager.create_fd_content("Small content").split('fd="')[1].split('"')[0]
+    small_fd_id = manager.create_fd("Small content")[0]
     assert manager.file_descriptors[small_fd_id]["total_pages"] == 1
 
     # Large content - multiple pages
     large_content = "\n".join(["X" * 100] * 5)  # 500+ chars
-    large_fd_id = manager.create_fd_content(large_content).split('fd="')[1].split('"')[0]
+    large_fd_id = manager.create_fd(large_content)[0]
     assert manager.file_descriptors[large_fd_id]["total_pages"] > 1
     assert manager.file_descriptors[large_fd_id]["total_pages"] >= 2
 
@@ -283,3 +295,6 @@ def test_calculate_total_pages_and_fd_tools():
     # Test registering custom FD tool
     manager.register_fd_tool("custom_fd_tool")
     assert manager.is_fd_related_tool("custom_fd_tool")
+    # Registration is per manager; the shared default registry stays untouched
+    assert "custom_fd_tool" not in FD_RELATED_TOOLS
+    assert not FileDescriptorManager().is_fd_related_tool("custom_fd_tool")
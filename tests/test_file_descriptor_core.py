@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from llmproc.common.results import ToolResult
 from llmproc.file_descriptors import FileDescriptorManager
+from llmproc.file_descriptors.paginator import get_page_content, index_lines, index_pages
 
 # File descriptor XML tag constants - defined here since they're internal
 FD_RESULT_OPENING_TAG = "<fd_result"
@@ -130,6 +131,44 @@ def test_extract_fd_id_manually():
     assert fd_match is None
 
 
+def test_clone_shares_content_but_not_entries():
+    """Test that a cloned manager shares FD payloads but has independent entries."""
+    # Arrange
+    manager = FileDescriptorManager()
+    fd_id, _ = manager.create_fd("Shared content\n" * 100)
+
+    # Act
+    cloned = manager.clone()
+    cloned.create_fd("Fork-only content")
+    cloned.file_descriptors[fd_id]["source"] = "forked"
+
+    # Assert - payload is shared, entry dicts and FD tables are not
+    assert cloned.file_descriptors[fd_id]["content"] is manager.file_descriptors[fd_id]["content"]
+    assert manager.file_descriptors[fd_id]["source"] == "tool_result"
+    assert "fd:2" in cloned.file_descriptors
+    assert "fd:2" not in manager.file_descriptors
+
+
+def test_identical_payloads_are_stored_once():
+    """Test that creating FDs with equal content reuses one payload and line index."""
+    # Arrange - build equal strings that are distinct objects
+    manager = FileDescriptorManager()
+    first = "".join(["Repeated output\n"] * 50)
+    second = "".join(["Repeated output\n"] * 50)
+    assert first is not second
+
+    # Act
+    first_id, _ = manager.create_fd(first)
+    second_id, _ = manager.create_fd(second, page_size=100)
+
+    # Assert - separate FDs share the stored payload and index
+    first_entry = manager.file_descriptors[first_id]
+    second_entry = manager.file_descriptors[second_id]
+    assert second_entry["content"] is first_entry["content"]
+    assert second_entry["lines"] is first_entry["lines"]
+    assert second_entry["page_size"] == 100
+
+
 def test_fd_removal():
     """Test file descriptor removal by directly manipulating the dictionary."""
     # Arrange
@@ -176,6 +215,35 @@ def test_fd_pagination():
         invalid_page = manager.read_fd_content(fd_id, mode="line", start=99, count=1)
 
 
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("", [0]),
+        ("single line", [0]),
+        ("a\nbb\nccc", [0, 2, 5]),
+        ("trailing\n", [0]),
+        ("\n\n", [0, 1]),
+        ("a\r\nb", [0, 3]),
+    ],
+)
+def test_index_lines(content, expected):
+    """Test line start indexing, including empty lines and a trailing newline."""
+    assert index_lines(content) == (expected, len(expected))
+
+
+def test_precomputed_page_spans_match_line_scan():
+    """Test that page reads using precomputed spans match the line-scanning path."""
+    # Arrange - mixed line lengths so pages start and end mid-line
+    content = "Short\n" + "A much longer line that spans several pages\n" * 3 + "\n\nEnd"
+    lines, _ = index_lines(content)
+    page_spans = index_pages(content, lines, page_size=16)
+
+    # Act / Assert - one span per page window, each identical to the scanned result
+    assert len(page_spans) == -(-len(content) // 16)
+    for page in range(1, len(page_spans) + 2):
+        assert get_page_content(content, lines, 16, page, page_spans) == get_page_content(content, lines, 16, page)
+
+
 def test_fd_offset_limit():
     """Test offset and limit parameters for fd content retrieval."""
     # Arrange
@@ -209,8 +277,7 @@ def test_advanced_positioning_modes():
     line_content = "\n".join([f"Line {i + 1}: This is test content line {i + 1}" for i in range(20)])
 
     # Create file descriptor
-    line_fd_xml = manager.create_fd_content(line_content)
-    line_fd_id = line_fd_xml.split('fd="')[1].split('"')[0]
+    line_fd_id, _ = manager.create_fd(line_content)
 
     # Act - Test line-based positioning with different parameters
     content_offset_5 = manager.read_fd_content(line_fd_id, mode="line", start=6, count=3)
@@ -68,16 +68,8 @@ async def test_fd_copy_during_fork(mock_get_provider_client):
         * 3
     )
 
-    fd1_xml = process.fd_manager.create_fd_content(fd1_content)
-    fd2_xml = process.fd_manager.create_fd_content(fd2_content)
-
-    # For test assertions, wrap in ToolResult
-    fd1_result = ToolResult(content=fd1_xml, is_error=False)
-    fd2_result = ToolResult(content=fd2_xml, is_error=False)
-
-    # Extract fd IDs
-    fd1_id = fd1_result.content.split('fd="')[1].split('"')[0]
-    fd2_id = fd2_result.content.split('fd="')[1].split('"')[0]
+    fd1_id, _ = process.fd_manager.create_fd(fd1_content)
+    fd2_id, _ = process.fd_manager.create_fd(fd2_content)
 
     # Verify FDs were created with expected IDs
     assert fd1_id == "fd:1"
@@ -168,31 +160,19 @@ def test_fd_pagination_with_very_long_lines():
     long_line = "\n".join(["This is line " + str(i) + " " * 20 for i in range(50)])  # 50 lines with reasonable length
 
     # Create FD
-    fd_xml = manager.create_fd_content(long_line)
-    # For test assertions, wrap in ToolResult
-    fd_result = ToolResult(content=fd_xml, is_error=False)
-    fd_id = fd_result.content.split('fd="')[1].split('"')[0]
+    fd_id, _ = manager.create_fd(long_line)
 
     # Verify we have multiple pages
     assert manager.file_descriptors[fd_id]["total_pages"] > 1
 
     # Read first page and verify it contains content
-    xml1 = manager.read_fd_content(fd_id, mode="page", start=1)
-    # For test assertions, wrap in ToolResult
-    result1 = ToolResult(content=xml1, is_error=False)
-    page1_content = result1.content.split(">\n")[1].split("\n</fd_content")[0]
+    page1_content, _ = manager.read_fd_raw(fd_id, mode="page", start=1)
     assert len(page1_content) > 0
     assert len(page1_content) <= manager.default_page_size  # Should be limited by page size
 
-    # Read all pages
-    xml_all = manager.read_fd_content(fd_id, read_all=True)
-    # For test assertions, wrap in ToolResult
-    result_all = ToolResult(content=xml_all, is_error=False)
-
-    # Should have the complete original content
-    extracted_content = result_all.content.split(">\n")[1].split("\n</fd_content")[0]
-    # Check if content length matches
-    assert len(extracted_content) == len(long_line)
+    # Read all pages - should have the complete original content
+    extracted_content, _ = manager.read_fd_raw(fd_id, read_all=True)
+    assert extracted_content == long_line
 
 
 def test_fd_pagination_with_mixed_line_lengths():
@@ -207,10 +187,7 @@ def test_fd_pagination_with_mixed_line_lengths():
     content += "Final short line"
 
     # Create FD
-    fd_xml = manager.create_fd_content(content)
-    # For test assertions, wrap in ToolResult
-    fd_result = ToolResult(content=fd_xml, is_error=False)
-    fd_id = fd_result.content.split('fd="')[1].split('"')[0]
+    fd_id, _ = manager.create_fd(content)
 
     # Get total pages
     total_pages = manager.file_descriptors[fd_id]["total_pages"]
@@ -218,13 +195,8 @@ def test_fd_pagination_with_mixed_line_lengths():
     # Read each page and collect line information
     all_lines_info = []
     for page in range(1, total_pages + 1):
-        xml = manager.read_fd_content(fd_id, mode="page", start=page)
-        # For test assertions, wrap in ToolResult
-        result = ToolResult(content=xml, is_error=False)
-
-        # Extract line range
-        lines_attr = result.content.split('lines="')[1].split('"')[0]
-        all_lines_info.append(lines_attr)
+        _, metadata = manager.read_fd_raw(fd_id, mode="page", start=page)
+        all_lines_info.append(metadata["lines"])
 
     # Verify line continuity (each page should start where the previous ended)
     for i in range(len(all_lines_info) - 1):
@@ -233,16 +205,13 @@ def test_fd_pagination_with_mixed_line_lengths():
         assert next_start == current_end, f"Line discontinuity between pages {i + 1} and {i + 2}"
 
     # Read all content
-    xml_all = manager.read_fd_content(fd_id, read_all=True)
-    # For test assertions, wrap in ToolResult
-    result_all = ToolResult(content=xml_all, is_error=False)
+    extracted_content, metadata = manager.read_fd_raw(fd_id, read_all=True)
 
     # Should have a line range from 1 to the total line count
     total_line_count = manager.file_descriptors[fd_id]["total_lines"]
-    assert f'lines="1-{total_line_count}"' in result_all.content
+    assert metadata["lines"] == f"1-{total_line_count}"
 
-    # Extract content and verify it matches the original
-    extracted_content = result_all.content.split(">\n")[1].split("\n</fd_content")[0]
+    # Verify content matches the original
     assert extracted_content == content
 
 
@@ -271,10 +240,7 @@ def test_recursive_fd_protection():
 
     # Create a file descriptor with large content
     large_content = "This is large content for testing" * 10
-    fd_xml = fd_manager.create_fd_content(large_content)
-    # For test assertions, wrap in ToolResult
-    fd_result = ToolResult(content=fd_xml, is_error=False)
-    fd_id = fd_result.content.split('fd="')[1].split('"')[0]
+    fd_id, _ = fd_manager.create_fd(large_content)
 
     # Verify FD exists
     assert fd_id in fd_manager.file_descriptors
@@ -447,9 +447,7 @@ async def test_mcp_tools_initialization(mock_env, mock_get_provider_client):
         "file_descriptor_enabled": False,
     }
 
-    # Mock the import in integration.py
     with (
-        patch.dict("sys.modules", {"llmproc.mcp_registry": MagicMock()}),
         patch.object(program, "get_tool_configuration", return_value=mock_config),
         patch.object(program.tool_manager, "initialize_tools") as mock_init_tools,
     ):
@@ -484,10 +482,7 @@ async def test_mcp_tool_initialization_in_create_process(mock_env, mock_get_prov
     )
 
     # Mock program_exec.create_process to verify how it handles MCP initialization
-    with (
-        patch("llmproc.program_exec.create_process") as mock_create_process,
-        patch.dict("sys.modules", {"llmproc.mcp_registry": MagicMock()}),
-    ):
+    with patch("llmproc.program_exec.create_process") as mock_create_process:
         # Configure mock
         mock_process = MagicMock()
         mock_process.provider = "anthropic"
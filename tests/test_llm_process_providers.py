@@ -5,7 +5,10 @@ import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from llmproc import LLMProcess
+from llmproc import LLMProcess, SyncLLMProcess
+from llmproc.program import LLMProgram
+
+from tests.conftest import create_test_llmprocess_directly
 
 
 @pytest.fixture
@@ -37,11 +40,6 @@ def test_openai_provider_run(mock_openai, mock_env):
     mock_choices[0].message = mock_message
     mock_message.content = "Test response from OpenAI"
 
-    # Create LLMProcess using the helper function
-    from llmproc.program import LLMProgram
-
-    from tests.conftest import create_test_llmprocess_directly
-
     # Create program and process
     program = LLMProgram(
         model_name="gpt-4o-mini",
@@ -56,9 +54,6 @@ def test_openai_provider_run(mock_openai, mock_env):
         state=[],  # Start with empty state
     )
 
-    # Create a SyncLLMProcess for synchronous testing
-    from llmproc import SyncLLMProcess
-
     # Create a sync process wrapper around our mocked process (without passing executor)
     sync_process = SyncLLMProcess(
         _loop=asyncio.new_event_loop(),
@@ -113,11 +108,6 @@ def test_anthropic_provider_run(mock_anthropic, mock_env):
     mock_response.content = mock_content
     mock_content[0].text = "Test response from Anthropic"
 
-    # Create LLMProcess using the helper function
-    from llmproc.program import LLMProgram
-
-    from tests.conftest import create_test_llmprocess_directly
-
     # Create program and process
     program = LLMProgram(
         model_name="claude-3-5-sonnet-20241022",
@@ -132,9 +122,6 @@ def test_anthropic_provider_run(mock_anthropic, mock_env):
         state=[],  # Start with empty state
     )
 
-    # Create a SyncLLMProcess for synchronous testing
-    from llmproc import SyncLLMProcess
-
     # Create a sync process wrapper around our mocked process (without passing executor)
     sync_process = SyncLLMProcess(
         _loop=asyncio.new_event_loop(),
@@ -189,11 +176,6 @@ def test_anthropic_vertex_provider_run(mock_vertex, mock_env):
     mock_response.content = mock_content
     mock_content[0].text = "Test response from Anthropic Vertex"
 
-    # Create LLMProcess using the helper function
-    from llmproc.program import LLMProgram
-
-    from tests.conftest import create_test_llmprocess_directly
-
     # Create program and process
     program = LLMProgram(
         model_name="claude-3-haiku@20240307",
@@ -208,9 +190,6 @@ def test_anthropic_vertex_provider_run(mock_vertex, mock_env):
         state=[],  # Start with empty state
     )
 
-    # Create a SyncLLMProcess for synchronous testing
-    from llmproc import SyncLLMProcess
-
     # Create a sync process wrapper around our mocked process (without passing executor)
     sync_process = SyncLLMProcess(
         _loop=asyncio.new_event_loop(),
@@ -245,30 +245,28 @@ def test_system_prompt_file_error():
         assert "non-existent-prompt.md" in str(excinfo.value)
 
 
-def test_mcp_config_file_error():
+def test_mcp_config_file_error(tmp_path):
     """Test error when MCP config file is not found."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a program file with a non-existent MCP config file
-        toml_path = Path(temp_dir) / "test_program.toml"
-        with open(toml_path, "w") as f:
-            f.write(
-                """
-            [model]
-            name = "test-model"
-            provider = "anthropic"
-
-            [prompt]
-            system_prompt = "Test system prompt"
-
-            [mcp]
-            config_path = "non-existent-config.json"
-            """
-            )
-
-        # Check for FileNotFoundError when loading from TOML
-        with pytest.raises(FileNotFoundError) as excinfo:
-            LLMProgram.from_toml(toml_path)
-
-        # Verify the error message includes both the specified and resolved paths
-        assert "MCP config file not found" in str(excinfo.value)
-        assert "non-existent-config.json" in str(excinfo.value)
+    # Create a program file with a non-existent MCP config file
+    toml_path = tmp_path / "test_program.toml"
+    toml_path.write_text(
+        """
+        [model]
+        name = "test-model"
+        provider = "anthropic"
+
+        [prompt]
+        system_prompt = "Test system prompt"
+
+        [mcp]
+        config_path = "non-existent-config.json"
+        """
+    )
+
+    # Check for FileNotFoundError when loading from TOML
+    with pytest.raises(FileNotFoundError) as excinfo:
+        LLMProgram.from_toml(toml_path)
+
+    # Verify the error message includes both the specified and resolved paths
+    assert "MCP config file not found" in str(excinfo.value)
+    assert "non-existent-config.json" in str(excinfo.value)
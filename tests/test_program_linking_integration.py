@@ -7,32 +7,21 @@ This file consolidates the integration tests for program linking from:
 - test_program_linking_robust.py (API aspects)
 """
 
-import asyncio
 import os
-import tempfile
 import time
 from pathlib import Path
 from textwrap import dedent
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
-from llmproc.common.results import RunResult, ToolResult
 from llmproc.program import LLMProgram
 from llmproc.tools.builtin import spawn_tool
 
-from tests.conftest import create_test_llmprocess_directly
 
 # Constants for model names - use the smallest models possible for tests
 CLAUDE_MODEL = "claude-3-5-haiku-20241022"  # Faster model for testing
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing program linking."""
-    with tempfile.TemporaryDirectory() as temp_dir_path:
-        yield Path(temp_dir_path)
-
-
 @pytest.fixture
 def program_linking_example_path():
     """Get the path to the program linking example directory."""
@@ -86,13 +75,12 @@ def test_real_examples_compilation(program_linking_example_path):
         assert len(program.linked_program_descriptions) > 0
 
 
-def test_program_linking_configuration(temp_dir):
+def test_program_linking_configuration(tmp_path):
     """Test program linking configuration through TOML files."""
     # Create main program TOML
-    main_toml = temp_dir / "main_config.toml"
-    with open(main_toml, "w") as f:
-        f.write(
-            """
+    main_toml = tmp_path / "main_config.toml"
+    main_toml.write_text(
+        """
         [model]
         name = "main-model"
         provider = "anthropic"
@@ -107,13 +95,12 @@ def test_program_linking_configuration(temp_dir):
         helper = { path = "helper_config.toml", description = "Helper program description" }
         expert = { path = "expert_config.toml", description = "Expert program description" }
         """
-        )
+    )
 
     # Create helper program TOML
-    helper_toml = temp_dir / "helper_config.toml"
-    with open(helper_toml, "w") as f:
-        f.write(
-            """
+    helper_toml = tmp_path / "helper_config.toml"
+    helper_toml.write_text(
+        """
         [model]
         name = "helper-model"
         provider = "anthropic"
@@ -121,13 +108,12 @@ def test_program_linking_configuration(temp_dir):
         [prompt]
         system_prompt = "Helper program"
         """
-        )
+    )
 
     # Create expert program TOML
-    expert_toml = temp_dir / "expert_config.toml"
-    with open(expert_toml, "w") as f:
-        f.write(
-            """
+    expert_toml = tmp_path / "expert_config.toml"
+    expert_toml.write_text(
+        """
         [model]
         name = "expert-model"
         provider = "anthropic"
@@ -135,7 +121,7 @@ def test_program_linking_configuration(temp_dir):
         [prompt]
         system_prompt = "Expert program"
         """
-        )
+    )
 
     # Load the program
     program = LLMProgram.from_toml(main_toml)
@@ -151,6 +137,7 @@ def test_program_linking_configuration(temp_dir):
     assert program.linked_program_descriptions["helper"] == "Helper program description"
     assert program.linked_program_descriptions["expert"] == "Expert program description"
 
+
 def test_linked_program_descriptions():
     """Test program linking with descriptions."""
     # Create parent program with descriptions
@@ -183,9 +170,6 @@ def test_linked_program_error_handling():
     program = LLMProgram(model_name="main-model", provider="anthropic", system_prompt="Main program with tools")
 
     # Register the spawn tool using function reference
-    # Import the function reference from builtin tools
-    from llmproc.tools.builtin import spawn_tool
-
     program.register_tools([spawn_tool])
 
     # No linked programs are added
@@ -206,56 +190,53 @@ def check_api_keys():
 
 
 @pytest.fixture
-def api_temp_toml_files():
+def api_temp_toml_files(tmp_path):
     """Create minimal TOML configurations for API testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create main program TOML with smaller model and reduced tokens
-        main_toml_path = Path(temp_dir) / "main.toml"
-        with open(main_toml_path, "w") as f:
-            f.write(
-                dedent(
-                    f"""
-            [model]
-            name = "{CLAUDE_MODEL}"
-            provider = "anthropic"
-
-            [prompt]
-            system_prompt = "You are an assistant with access to a knowledge expert. When asked about 'the secret code' or 'sky color', use the spawn tool to ask the expert."
-
-            [parameters]
-            max_tokens = 150
-            temperature = 0
-
-            [tools]
-            builtin = ["spawn"]
-
-            [linked_programs]
-            expert = {{ path = "expert.toml", description = "A knowledge expert who knows secret information" }}
-            """
-                )
-            )
-
-        # Create expert program TOML
-        expert_toml_path = Path(temp_dir) / "expert.toml"
-        with open(expert_toml_path, "w") as f:
-            f.write(
-                dedent(
-                    f"""
-            [model]
-            name = "{CLAUDE_MODEL}"
-            provider = "anthropic"
-
-            [prompt]
-            system_prompt = "You are a knowledge expert. You know that 'the secret code' is 12345 and 'the sky color' is blue."
-
-            [parameters]
-            max_tokens = 50
-            temperature = 0
-            """
-                )
-            )
-
-        yield {"main": main_toml_path, "expert": expert_toml_path}
+    # Create main program TOML with smaller model and reduced tokens
+    main_toml_path = tmp_path / "main.toml"
+    main_toml_path.write_text(
+        dedent(
+            f"""
+        [model]
+        name = "{CLAUDE_MODEL}"
+        provider = "anthropic"
+
+        [prompt]
+        system_prompt = "You are an assistant with access to a knowledge expert. When asked about 'the secret code' or 'sky color', use the spawn tool to ask the expert."
+
+        [parameters]
+        max_tokens = 150
+        temperature = 0
+
+        [tools]
+        builtin = ["spawn"]
+
+        [linked_programs]
+        expert = {{ path = "expert.toml", description = "A knowledge expert who knows secret information" }}
+        """
+        )
+    )
+
+    # Create expert program TOML
+    expert_toml_path = tmp_path / "expert.toml"
+    expert_toml_path.write_text(
+        dedent(
+            f"""
+        [model]
+        name = "{CLAUDE_MODEL}"
+        provider = "anthropic"
+
+        [prompt]
+        system_prompt = "You are a knowledge expert. You know that 'the secret code' is 12345 and 'the sky color' is blue."
+
+        [parameters]
+        max_tokens = 50
+        temperature = 0
+        """
+        )
+    )
+
+    return {"main": main_toml_path, "expert": expert_toml_path}
 
 
 @pytest.mark.llm_api
@@ -329,7 +310,7 @@ async def test_program_linking_resets_state(api_temp_toml_files):
 
 @pytest.mark.llm_api
 @pytest.mark.asyncio
-async def test_program_linking_descriptions_with_api():
+async def test_program_linking_descriptions_with_api(tmp_path):
     """Test program linking descriptions with API."""
     # Skip if no API key is available
     for key_name in ["VERTEX_AI_PROJECT", "VERTEX_AI_LOCATION", "ANTHROPIC_API_KEY"]:
@@ -338,83 +319,76 @@ async def test_program_linking_descriptions_with_api():
     else:
         pytest.skip("API environment variables not set")
 
-    # Create temporary directory for test files
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_dir_path = Path(temp_dir)
-
-        # Create test files
-        main_toml = temp_dir_path / "main.toml"
-        expert_toml = temp_dir_path / "expert.toml"
-
-        # Create the expert TOML
-        expert_toml_content = dedent(
-            f"""
-        [model]
-        name = "{CLAUDE_MODEL}"
-        provider = "anthropic"
-        display_name = "Expert"
-
-        [prompt]
-        system_prompt = "You are an expert assistant. When asked about your role, explain that you are an expert with knowledge about program descriptions."
-
-        [parameters]
-        max_tokens = 150
-        temperature = 0
-        """
-        )
+    # Create test files
+    main_toml = tmp_path / "main.toml"
+    expert_toml = tmp_path / "expert.toml"
+
+    # Create the expert TOML
+    expert_toml_content = dedent(
+        f"""
+    [model]
+    name = "{CLAUDE_MODEL}"
+    provider = "anthropic"
+    display_name = "Expert"
+
+    [prompt]
+    system_prompt = "You are an expert assistant. When asked about your role, explain that you are an expert with knowledge about program descriptions."
+
+    [parameters]
+    max_tokens = 150
+    temperature = 0
+    """
+    )
 
-        with open(expert_toml, "w") as f:
-            f.write(expert_toml_content)
+    expert_toml.write_text(expert_toml_content)
 
-        # Create the main TOML with descriptions
-        main_toml_content = dedent(
-            f"""
-        [model]
-        name = "{CLAUDE_MODEL}"
-        provider = "anthropic"
-        display_name = "Main"
+    # Create the main TOML with descriptions
+    main_toml_content = dedent(
+        f"""
+    [model]
+    name = "{CLAUDE_MODEL}"
+    provider = "anthropic"
+    display_name = "Main"
 
-        [prompt]
-        system_prompt = "You are a helpful assistant with access to experts. For this test, when asked what experts you have access to, query the expert using the spawn tool."
+    [prompt]
+    system_prompt = "You are a helpful assistant with access to experts. For this test, when asked what experts you have access to, query the expert using the spawn tool."
 
-        [parameters]
-        max_tokens = 150
-        temperature = 0
+    [parameters]
+    max_tokens = 150
+    temperature = 0
 
-        [tools]
-        builtin = ["spawn"]
+    [tools]
+    builtin = ["spawn"]
 
-        [linked_programs]
-        expert = {{ path = "{expert_toml.name}", description = "Specialized expert with knowledge about program descriptions" }}
-        """
-        )
+    [linked_programs]
+    expert = {{ path = "{expert_toml.name}", description = "Specialized expert with knowledge about program descriptions" }}
+    """
+    )
 
-        with open(main_toml, "w") as f:
-            f.write(main_toml_content)
+    main_toml.write_text(main_toml_content)
 
-        # Create and initialize the program with the API
-        program = LLMProgram.from_toml(main_toml)
-        process = await program.start()
+    # Create and initialize the program with the API
+    program = LLMProgram.from_toml(main_toml)
+    process = await program.start()
 
-        # Check that the descriptions were parsed correctly
-        assert hasattr(program, "linked_program_descriptions")
-        assert "expert" in program.linked_program_descriptions
-        assert (
-            program.linked_program_descriptions["expert"]
-            == "Specialized expert with knowledge about program descriptions"
-        )
+    # Check that the descriptions were parsed correctly
+    assert hasattr(program, "linked_program_descriptions")
+    assert "expert" in program.linked_program_descriptions
+    assert (
+        program.linked_program_descriptions["expert"] == "Specialized expert with knowledge about program descriptions"
+    )
 
-        # Check that the spawn tool shows descriptions
-        spawn_tool = next((tool for tool in process.tools if tool["name"] == "spawn"), None)
-        assert spawn_tool is not None
-        assert "expert" in spawn_tool["description"]
-        assert "Specialized expert" in spawn_tool["description"]
+    # Check that the spawn tool shows descriptions
+    spawn_tool = next((tool for tool in process.tools if tool["name"] == "spawn"), None)
+    assert spawn_tool is not None
+    assert "expert" in spawn_tool["description"]
+    assert "Specialized expert" in spawn_tool["description"]
 
-        # Run the process with a prompt that will use the spawn tool
-        test_prompt = "What experts do you have access to and what are they specialized in?"
-        result = await process.run(test_prompt)
+    # Run the process with a prompt that will use the spawn tool
+    test_prompt = "What experts do you have access to and what are they specialized in?"
+    result = await process.run(test_prompt)
 
-        # Verify the result
-        final_message = process.get_last_message()
-        assert "expert" in final_message.lower()
-        assert "description" in final_message.lower()
+    # Verify the result
+    final_message = process.get_last_message()
+    assert "expert" in final_message.lower()
+    assert "description" in final_message.lower()
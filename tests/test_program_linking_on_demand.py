@@ -1,7 +1,7 @@
 """Tests for program-to-process refactoring."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from llmproc.llm_process import LLMProcess
@@ -41,7 +41,7 @@ async def test_process_stores_program_references_not_instances():
     main_program.add_linked_program("expert", linked_program, "Expert program")
 
     # Create a process from the main program
-    with patch("llmproc.program_exec.get_provider_client", return_value=MagicMock()):
+    with patch("llmproc.program_exec.get_provider_client", return_value=object()):
         process = await main_program.start()
 
     # Verify that linked_programs contains the program reference, not a process instance
@@ -65,7 +65,7 @@ async def test_linked_programs_from_program_only(test_program):
     test_program.linked_programs = {"test": linked_program}
 
     # Create a process
-    with patch("llmproc.program_exec.get_provider_client", return_value=MagicMock()):
+    with patch("llmproc.program_exec.get_provider_client", return_value=object()):
         # Our improved helper will automatically use the program's linked_programs
         process = create_test_llmprocess_directly(program=test_program)
 
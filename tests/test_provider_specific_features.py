@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from llmproc.providers.anthropic_process_executor import AnthropicProcessExecutor
 from llmproc.providers.anthropic_utils import (
+    TOKEN_EFFICIENT_TOOLS_BETA,
     apply_cache_control,
     format_system_prompt,
     prepare_api_request,
@@ -220,13 +221,13 @@ class TestProviderSpecificUnitTests:
         # Act - Apply token-efficient tools logic
         if "anthropic" in mock_process.provider.lower() and mock_process.model_name.startswith("claude-3-7"):
             if "anthropic-beta" not in extra_headers:
-                extra_headers["anthropic-beta"] = "token-efficient-tools-2025-02-19"
+                extra_headers["anthropic-beta"] = TOKEN_EFFICIENT_TOOLS_BETA
             elif "token-efficient-tools" not in extra_headers["anthropic-beta"]:
-                extra_headers["anthropic-beta"] += ",token-efficient-tools-2025-02-19"
+                extra_headers["anthropic-beta"] += f",{TOKEN_EFFICIENT_TOOLS_BETA}"
 
         # Assert - Direct Anthropic
         assert "anthropic-beta" in extra_headers
-        assert extra_headers["anthropic-beta"] == "token-efficient-tools-2025-02-19"
+        assert extra_headers["anthropic-beta"] == TOKEN_EFFICIENT_TOOLS_BETA
 
         # Arrange - Vertex AI
         mock_process.provider = "anthropic_vertex"
@@ -235,18 +236,18 @@ class TestProviderSpecificUnitTests:
         # Act - Apply token-efficient tools logic
         if "anthropic" in mock_process.provider.lower() and mock_process.model_name.startswith("claude-3-7"):
             if "anthropic-beta" not in extra_headers:
-                extra_headers["anthropic-beta"] = "token-efficient-tools-2025-02-19"
+                extra_headers["anthropic-beta"] = TOKEN_EFFICIENT_TOOLS_BETA
             elif "token-efficient-tools" not in extra_headers["anthropic-beta"]:
-                extra_headers["anthropic-beta"] += ",token-efficient-tools-2025-02-19"
+                extra_headers["anthropic-beta"] += f",{TOKEN_EFFICIENT_TOOLS_BETA}"
 
         # Assert - Vertex AI
         assert "anthropic-beta" in extra_headers
-        assert extra_headers["anthropic-beta"] == "token-efficient-tools-2025-02-19"
+        assert extra_headers["anthropic-beta"] == TOKEN_EFFICIENT_TOOLS_BETA
 
         # Arrange - Non-Claude 3.7 model
         mock_process.provider = "anthropic"
         mock_process.model_name = "claude-3-5-sonnet"
-        extra_headers = {"anthropic-beta": "token-efficient-tools-2025-02-19"}
+        extra_headers = {"anthropic-beta": TOKEN_EFFICIENT_TOOLS_BETA}
 
         # Act & Assert - Check warning logic
         with patch("llmproc.providers.anthropic_process_executor.logger") as mock_logger:
@@ -341,7 +342,7 @@ class TestProviderSpecificAPITests:
                 messages=[{"role": "user", "content": prompt}],
                 tools=[calculator_tool],
                 system="You are a helpful AI assistant that uses tools when appropriate.",
-                extra_headers={"anthropic-beta": "token-efficient-tools-2025-02-19"},
+                extra_headers={"anthropic-beta": TOKEN_EFFICIENT_TOOLS_BETA},
             )
 
             # Assert - Compare token usage
@@ -1,105 +1,68 @@
 """Tests for the providers module."""
 
-import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
-from llmproc.providers import get_provider_client
+from llmproc.providers import get_provider_client, providers
 from llmproc.providers.constants import PROVIDER_GEMINI, PROVIDER_GEMINI_VERTEX
 
 
 @pytest.fixture
-def mock_env():
+def mock_env(monkeypatch):
     """Mock environment variables."""
-    original_env = os.environ.copy()
-    os.environ["OPENAI_API_KEY"] = "test-openai-key"
-    os.environ["ANTHROPIC_API_KEY"] = "test-anthropic-key"
-    os.environ["ANTHROPIC_VERTEX_PROJECT_ID"] = "test-vertex-project"
-    os.environ["CLOUD_ML_REGION"] = "us-central1-vertex"
-    os.environ["GEMINI_API_KEY"] = "test-gemini-key"
-    os.environ["GOOGLE_CLOUD_PROJECT"] = "test-google-project"
-    yield
-    os.environ.clear()
-    os.environ.update(original_env)
-
-
-@patch("llmproc.providers.providers.AsyncOpenAI")
-def test_get_openai_provider(mock_openai, mock_env):
-    """Test getting OpenAI provider."""
-    mock_client = MagicMock()
-    mock_openai.return_value = mock_client
-
-    client = get_provider_client("openai", "gpt-4o")
-
-    mock_openai.assert_called_once_with(api_key="test-openai-key")
-    assert client == mock_client
-
-
-@patch("llmproc.providers.providers.AsyncOpenAI", None)
-def test_get_openai_provider_missing_import(mock_env):
-    """Test getting OpenAI provider when import fails."""
-    with pytest.raises(ImportError):
-        get_provider_client("openai", "gpt-4o")
-
-
-@patch("llmproc.providers.providers.AsyncAnthropic", None)
-def test_get_anthropic_provider_missing_import(mock_env):
-    """Test getting Anthropic provider when import fails."""
-    with pytest.raises(ImportError):
-        get_provider_client("anthropic", "claude-3-5-sonnet-20241022")
-
-
-@patch("llmproc.providers.providers.AsyncAnthropic")
-def test_get_anthropic_provider(mock_anthropic, mock_env):
-    """Test getting Anthropic provider."""
-    mock_client = MagicMock()
-    mock_anthropic.return_value = mock_client
-
-    client = get_provider_client("anthropic", "claude-3-5-sonnet-20241022")
-
-    mock_anthropic.assert_called_once_with(api_key="test-anthropic-key")
-    assert client == mock_client
-
-
-@patch("llmproc.providers.providers.AsyncAnthropicVertex", None)
-def test_get_anthropic_vertex_provider_missing_import(mock_env):
-    """Test getting Anthropic Vertex provider when import fails."""
-    with pytest.raises(ImportError):
-        get_provider_client("anthropic_vertex", "claude-3-5-haiku@20241022")
-
-
-@patch("llmproc.providers.providers.AsyncAnthropicVertex")
-def test_get_anthropic_vertex_provider(mock_vertex, mock_env):
-    """Test getting Anthropic Vertex provider."""
-    mock_client = MagicMock()
-    mock_vertex.return_value = mock_client
-
-    client = get_provider_client("anthropic_vertex", "claude-3-5-haiku@20241022")
-
-    mock_vertex.assert_called_once_with(project_id="test-vertex-project", region="us-central1-vertex")
-    assert client == mock_client
-
-
-@patch("llmproc.providers.providers.AsyncAnthropicVertex")
-def test_get_anthropic_vertex_provider_with_params(mock_vertex, mock_env):
-    """Test getting Anthropic Vertex provider with explicit parameters."""
-    mock_client = MagicMock()
-    mock_vertex.return_value = mock_client
-
-    client = get_provider_client(
-        "anthropic_vertex",
-        "claude-3-5-haiku@20241022",
-        project_id="custom-project",
-        region="europe-west4",
-    )
-
-    mock_vertex.assert_called_once_with(project_id="custom-project", region="europe-west4")
-    assert client == mock_client
-
-
-@patch("llmproc.providers.providers.genai")
-def test_get_gemini_provider(mock_genai, mock_env):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-anthropic-key")
+    monkeypatch.setenv("ANTHROPIC_VERTEX_PROJECT_ID", "test-vertex-project")
+    monkeypatch.setenv("CLOUD_ML_REGION", "us-central1-vertex")
+    monkeypatch.setenv("GEMINI_API_KEY", "test-gemini-key")
+    monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-google-project")
+
+
+@pytest.mark.parametrize(
+    ("sdk_name", "provider", "model_name", "kwargs", "expected_call"),
+    [
+        pytest.param("AsyncOpenAI", "openai", "gpt-4o", {}, {"api_key": "test-openai-key"}, id="openai"),
+        pytest.param(
+            "AsyncAnthropic",
+            "anthropic",
+            "claude-3-5-sonnet-20241022",
+            {},
+            {"api_key": "test-anthropic-key"},
+            id="anthropic",
+        ),
+        pytest.param(
+            "AsyncAnthropicVertex",
+            "anthropic_vertex",
+            "claude-3-5-haiku@20241022",
+            {},
+            {"project_id": "test-vertex-project", "region": "us-central1-vertex"},
+            id="anthropic_vertex",
+        ),
+        pytest.param(
+            "AsyncAnthropicVertex",
+            "anthropic_vertex",
+            "claude-3-5-haiku@20241022",
+            {"project_id": "custom-project", "region": "europe-west4"},
+            {"project_id": "custom-project", "region": "europe-west4"},
+            id="anthropic_vertex_with_params",
+        ),
+    ],
+)
+def test_get_provider(monkeypatch, mock_env, sdk_name, provider, model_name, kwargs, expected_call):
+    """Test getting a provider client from its SDK class."""
+    mock_sdk = MagicMock()
+    monkeypatch.setattr(providers, sdk_name, mock_sdk)
+
+    client = get_provider_client(provider, model_name, **kwargs)
+
+    mock_sdk.assert_called_once_with(**expected_call)
+    assert client == mock_sdk.return_value
+
+
+def test_get_gemini_provider(monkeypatch, mock_env):
     """Test getting Gemini provider."""
+    mock_genai = MagicMock()
+    monkeypatch.setattr(providers, "genai", mock_genai)
     mock_client = MagicMock()
     mock_genai.Client.return_value = mock_client
 
@@ -109,9 +72,10 @@ def test_get_gemini_provider(mock_genai, mock_env):
     assert client == mock_client
 
 
-@patch("llmproc.providers.providers.genai")
-def test_get_gemini_vertex_provider(mock_genai, mock_env):
+def test_get_gemini_vertex_provider(monkeypatch, mock_env):
     """Test getting Gemini Vertex provider."""
+    mock_genai = MagicMock()
+    monkeypatch.setattr(providers, "genai", mock_genai)
     mock_client = MagicMock()
     mock_genai.Client.return_value = mock_client
 
@@ -123,9 +87,10 @@ def test_get_gemini_vertex_provider(mock_genai, mock_env):
     assert client == mock_client
 
 
-@patch("llmproc.providers.providers.genai")
-def test_get_gemini_vertex_provider_with_params(mock_genai, mock_env):
+def test_get_gemini_vertex_provider_with_params(monkeypatch, mock_env):
     """Test getting Gemini Vertex provider with explicit parameters."""
+    mock_genai = MagicMock()
+    monkeypatch.setattr(providers, "genai", mock_genai)
     mock_client = MagicMock()
     mock_genai.Client.return_value = mock_client
 
@@ -140,18 +105,21 @@ def test_get_gemini_vertex_provider_with_params(mock_genai, mock_env):
     assert client == mock_client
 
 
-@patch("llmproc.providers.providers.genai", None)
-def test_get_gemini_provider_missing_import(mock_env):
-    """Test getting Gemini provider when import fails."""
-    with pytest.raises(ImportError):
-        get_provider_client(PROVIDER_GEMINI, "gemini-2.0-flash")
-
-
-@patch("llmproc.providers.providers.genai", None)
-def test_get_gemini_vertex_provider_missing_import(mock_env):
-    """Test getting Gemini Vertex provider when import fails."""
+@pytest.mark.parametrize(
+    ("sdk_name", "provider", "model_name"),
+    [
+        pytest.param("AsyncOpenAI", "openai", "gpt-4o", id="openai"),
+        pytest.param("AsyncAnthropic", "anthropic", "claude-3-5-sonnet-20241022", id="anthropic"),
+        pytest.param("AsyncAnthropicVertex", "anthropic_vertex", "claude-3-5-haiku@20241022", id="anthropic_vertex"),
+        pytest.param("genai", PROVIDER_GEMINI, "gemini-2.0-flash", id="gemini"),
+        pytest.param("genai", PROVIDER_GEMINI_VERTEX, "gemini-2.0-flash", id="gemini_vertex"),
+    ],
+)
+def test_get_provider_missing_import(monkeypatch, mock_env, sdk_name, provider, model_name):
+    """Test getting a provider when its SDK import failed."""
+    monkeypatch.setattr(providers, sdk_name, None)
     with pytest.raises(ImportError):
-        get_provider_client(PROVIDER_GEMINI_VERTEX, "gemini-2.0-flash")
+        get_provider_client(provider, model_name)
 
 
 def test_get_unsupported_provider(mock_env):
@@ -72,98 +72,37 @@ def test_reasoning_model_parameter_transformation():
         assert "max_tokens" not in api_params
 
 
-def test_reasoning_model_configs(tmp_path):
-    """Test that the reasoning model configuration files load correctly using temporary files."""
-    import tempfile
-    from pathlib import Path
-
-    # Create temporary config files for each reasoning level
-    high_config = tmp_path / "o3-mini-high.toml"
-    medium_config = tmp_path / "o3-mini-medium.toml"
-    low_config = tmp_path / "o3-mini-low.toml"
-
-    # Write high reasoning config content
-    high_config.write_text(
-        """
-    [model]
-    name = "o3-mini"
-    provider = "openai"
-    display_name = "O3-Mini High Reasoning"
-
-    [prompt]
-    system_prompt = "You are a helpful AI assistant using high reasoning effort."
-
-    [parameters]
-    reasoning_effort = "high"
-    max_completion_tokens = 25000
-    temperature = 0.7
-    """
-    )
-
-    # Write medium reasoning config content
-    medium_config.write_text(
-        """
-    [model]
-    name = "o3-mini"
-    provider = "openai"
-    display_name = "O3-Mini Medium Reasoning"
-
-    [prompt]
-    system_prompt = "You are a helpful AI assistant using medium reasoning effort."
-
-    [parameters]
-    reasoning_effort = "medium"
-    max_completion_tokens = 10000
-    temperature = 0.7
-    """
-    )
-
-    # Write low reasoning config content
-    low_config.write_text(
-        """
-    [model]
-    name = "o3-mini"
-    provider = "openai"
-    display_name = "O3-Mini Low Reasoning"
-
-    [prompt]
-    system_prompt = "You are a helpful AI assistant using low reasoning effort."
-
-    [parameters]
-    reasoning_effort = "low"
-    max_completion_tokens = 5000
-    temperature = 0.7
-    """
-    )
-
-    # Load the three reasoning model configurations from the temporary files
-    high_program = LLMProgram.from_toml(high_config)
-    medium_program = LLMProgram.from_toml(medium_config)
-    low_program = LLMProgram.from_toml(low_config)
-
-    # Verify high reasoning configuration
-    assert high_program.model_name == "o3-mini"
-    assert high_program.provider == "openai"
-    assert "reasoning_effort" in high_program.parameters
-    assert high_program.parameters["reasoning_effort"] == "high"
-    assert "max_completion_tokens" in high_program.parameters
-    assert high_program.parameters["max_completion_tokens"] == 25000
-
-    # Verify medium reasoning configuration
-    assert medium_program.model_name == "o3-mini"
-    assert medium_program.provider == "openai"
-    assert "reasoning_effort" in medium_program.parameters
-    assert medium_program.parameters["reasoning_effort"] == "medium"
-    assert "max_completion_tokens" in medium_program.parameters
-    assert medium_program.parameters["max_completion_tokens"] == 10000
-
-    # Verify low reasoning configuration
-    assert low_program.model_name == "o3-mini"
-    assert low_program.provider == "openai"
-    assert "reasoning_effort" in low_program.parameters
-    assert low_program.parameters["reasoning_effort"] == "low"
-    assert "max_completion_tokens" in low_program.parameters
-    assert low_program.parameters["max_completion_tokens"] == 5000
+REASONING_CONFIG_TEMPLATE = """
+[model]
+name = "o3-mini"
+provider = "openai"
+display_name = "O3-Mini {title} Reasoning"
+
+[prompt]
+system_prompt = "You are a helpful AI assistant using {effort} reasoning effort."
+
+[parameters]
+reasoning_effort = "{effort}"
+max_completion_tokens = {tokens}
+temperature = 0.7
+"""
+
+
+@pytest.mark.parametrize(
+    ("effort", "tokens"),
+    [("high", 25000), ("medium", 10000), ("low", 5000)],
+)
+def test_reasoning_model_configs(tmp_path, effort, tokens):
+    """Test that a reasoning model configuration file loads correctly."""
+    config_path = tmp_path / f"o3-mini-{effort}.toml"
+    config_path.write_text(REASONING_CONFIG_TEMPLATE.format(title=effort.capitalize(), effort=effort, tokens=tokens))
+
+    program = LLMProgram.from_toml(config_path)
+
+    assert program.model_name == "o3-mini"
+    assert program.provider == "openai"
+    assert program.parameters["reasoning_effort"] == effort
+    assert program.parameters["max_completion_tokens"] == tokens
 
 
 def test_reasoning_model_validation():
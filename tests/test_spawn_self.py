@@ -1,6 +1,7 @@
 """Tests for spawning the current program when no linked programs are configured."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -14,9 +15,13 @@ from tests.conftest import create_test_llmprocess_directly
 async def test_spawn_self_when_no_linked_programs():
     """spawn_tool should spawn the current program when no linked programs exist."""
     with patch("llmproc.program_exec.create_process") as mock_create_process:
-        child_process = MagicMock()
-        child_process.run = AsyncMock(return_value=RunResult())
-        child_process.get_last_message = MagicMock(return_value="Self response")
+        queries = []
+
+        async def run(query):
+            queries.append(query)
+            return RunResult()
+
+        child_process = SimpleNamespace(run=run, get_last_message=lambda: "Self response")
         mock_create_process.return_value = child_process
 
         program = LLMProgram(model_name="test-model", provider="anthropic", system_prompt="test")
@@ -34,4 +39,4 @@ async def test_spawn_self_when_no_linked_programs():
         assert result.content == "Self response"
         mock_create_process.assert_called_once()
         assert mock_create_process.call_args[0][0] == program
-        child_process.run.assert_called_once_with("hello")
+        assert queries == ["hello"]
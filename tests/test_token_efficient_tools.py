@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from llmproc.providers.anthropic_process_executor import AnthropicProcessExecutor
+from llmproc.providers.anthropic_utils import TOKEN_EFFICIENT_TOOLS_BETA
 
 
 class TestTokenEfficientTools:
@@ -16,7 +17,7 @@ class TestTokenEfficientTools:
         executor = AnthropicProcessExecutor()
 
         # Create API params with token-efficient tools header
-        extra_headers = {"anthropic-beta": "token-efficient-tools-2025-02-19"}
+        extra_headers = {"anthropic-beta": TOKEN_EFFICIENT_TOOLS_BETA}
 
         # Test with non-Claude 3.7 model
         with patch("llmproc.providers.anthropic_process_executor.logger") as mock_logger:
@@ -49,7 +50,7 @@ class TestTokenEfficientTools:
         mock_client.messages.create = MagicMock(return_value=mock_response)
 
         # Test with anthropic-beta headers
-        extra_headers = {"anthropic-beta": "token-efficient-tools-2025-02-19"}
+        extra_headers = {"anthropic-beta": TOKEN_EFFICIENT_TOOLS_BETA}
 
         # Call the method synchronously since we're using a regular MagicMock
         mock_client.messages.create(
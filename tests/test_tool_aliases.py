@@ -8,7 +8,7 @@ import json
 import os
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+from unittest.mock import AsyncMock, PropertyMock, patch
 
 import pytest
 from llmproc import LLMProcess
@@ -59,57 +59,6 @@ def mock_env():
     os.environ.update(original_env)
 
 
-@pytest.fixture
-def mock_mcp_registry():
-    """Mock the MCP registry with time tool."""
-    # Create MCP registry module mock
-    mock_mcp_registry = MagicMock()
-
-    # Setup mocks for MCP components
-    mock_server_registry = MagicMock()
-    mock_server_registry_class = MagicMock()
-    mock_server_registry_class.from_config.return_value = mock_server_registry
-
-    mock_aggregator = MagicMock()
-    mock_aggregator_class = MagicMock()
-    mock_aggregator_class.return_value = mock_aggregator
-
-    # Create mock time tool
-    mock_tool = MagicMock()
-    mock_tool.name = "time.current"
-    mock_tool.description = "Get the current time"
-    mock_tool.inputSchema = {"type": "object", "properties": {}}
-
-    # Setup tool calls
-    mock_tools_result = MagicMock()
-    mock_tools_result.tools = [mock_tool]
-    mock_aggregator.list_tools = AsyncMock(return_value=mock_tools_result)
-
-    # Setup tool results
-    mock_tool_result = MagicMock()
-    mock_tool_result.content = {
-        "unix_timestamp": 1646870400,
-        "utc_time": "2022-03-10T00:00:00Z",
-        "timezone": "UTC",
-    }
-    mock_tool_result.isError = False
-    mock_aggregator.call_tool = AsyncMock(return_value=mock_tool_result)
-
-    # Create patches for the mcp_registry module
-    with patch.dict(
-        "sys.modules",
-        {
-            "llmproc.mcp_registry": mock_mcp_registry,
-        },
-    ):
-        # Set attributes on the mock module
-        mock_mcp_registry.ServerRegistry = mock_server_registry_class
-        mock_mcp_registry.MCPAggregator = mock_aggregator_class
-        mock_mcp_registry.get_config_path = MagicMock(return_value="/mock/config/path")
-
-        yield mock_aggregator
-
-
 def test_registry_registers_aliases():
     """Test that tool aliases are correctly registered in ToolRegistry."""
     registry = ToolRegistry()
@@ -222,9 +171,7 @@ def test_tool_manager_get_schemas_with_aliases():
     assert schemas_with_aliases[0]["name"] == "t"
 
 
-@patch.dict("sys.modules", {"llmproc.mcp_registry": MagicMock()})
-@patch("llmproc.providers.providers.AsyncAnthropic")
-def test_llm_program_set_tool_aliases(mock_anthropic, mock_env):
+def test_llm_program_set_tool_aliases(mock_env):
     """Test that aliases can be set through LLMProgram.set_tool_aliases."""
     # Create a program with some tools using function references
     program = LLMProgram(
@@ -278,14 +225,8 @@ def test_llm_program_set_tool_aliases(mock_anthropic, mock_env):
 
 
 @pytest.mark.asyncio
-@patch.dict("sys.modules", {"llmproc.mcp_registry": MagicMock()})
-@patch("llmproc.providers.providers.AsyncAnthropic")
-async def test_calling_tools_with_aliases(mock_anthropic, mock_env):
+async def test_calling_tools_with_aliases(mock_env):
     """Test calling tools using their aliases."""
-    # Setup mock client
-    mock_client = MagicMock()
-    mock_anthropic.return_value = mock_client
-
     # Create a program with calculator tool and alias using function reference
     program = LLMProgram(
         model_name="claude-3-5-haiku-20241022",
@@ -370,13 +311,8 @@ def test_alias_validation_detects_conflicts():
 
 
 @pytest.mark.asyncio
-@patch("llmproc.providers.providers.AsyncAnthropic")
-async def test_alias_error_messages(mock_anthropic, mock_env):
+async def test_alias_error_messages(mock_env):
     """Test that error messages include alias information when tools are called with aliases."""
-    # Setup mock client
-    mock_client = MagicMock()
-    mock_anthropic.return_value = mock_client
-
     # Create a program with calculator tool and alias using function reference
     program = LLMProgram(
         model_name="claude-3-5-haiku-20241022",
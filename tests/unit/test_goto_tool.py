@@ -4,6 +4,7 @@ These tests focus on the internal functionality of the GOTO tool without requiri
 """
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -49,6 +50,8 @@ class TestGotoToolUnit:
 
         # Test invalid IDs
         assert find_position_by_id(state, "invalid") is None
+        assert find_position_by_id(state, "msg_abc") is None
+        assert find_position_by_id(state, "msg_-1") is None
         assert find_position_by_id(state, None) is None
 
         # Test with state that has no message IDs at all
@@ -69,10 +72,7 @@ class TestGotoToolUnit:
     def test_append_message(self):
         """Test appending messages with IDs."""
         # Create a mock process with an empty state and tool_manager
-        process = MagicMock()
-        process.state = []
-        process.tool_manager = MagicMock()
-        process.tool_manager.message_ids_enabled = True
+        process = SimpleNamespace(state=[], tool_manager=SimpleNamespace(message_ids_enabled=True))
 
         # Append messages and verify IDs
         id1 = append_message_with_id(process, "user", "Message 1")
@@ -100,16 +100,18 @@ class TestGotoToolUnit:
         mock_datetime.datetime.now.return_value.isoformat.return_value = "2025-01-01T00:00:00"
 
         # Create a realistic process state with integer message IDs
-        process = MagicMock()
-        process.state = [
-            {"role": "user", "content": "Message 1", LLMPROC_MSG_ID: 0},
-            {"role": "assistant", "content": "Response 1", LLMPROC_MSG_ID: 1},
-            {"role": "user", "content": "Message 2", LLMPROC_MSG_ID: 2},
-            {"role": "assistant", "content": "Response 2", LLMPROC_MSG_ID: 3},
-        ]
-        process.time_travel_history = []
+        process = SimpleNamespace(
+            state=[
+                {"role": "user", "content": "Message 1", LLMPROC_MSG_ID: 0},
+                {"role": "assistant", "content": "Response 1", LLMPROC_MSG_ID: 1},
+                {"role": "user", "content": "Message 2", LLMPROC_MSG_ID: 2},
+                {"role": "assistant", "content": "Response 2", LLMPROC_MSG_ID: 3},
+            ],
+            time_travel_history=[],
+        )
 
         # Save original state for checking how it changes
+        original_state = process.state
         original_state_len = len(process.state)
 
         # Create runtime context with the process
@@ -130,6 +132,8 @@ class TestGotoToolUnit:
 
             # Verify the state was properly truncated
             assert mock_append.call_count == 0, "append_message_with_id should not be called when message is empty"
+            assert process.state is original_state, "state should be truncated in place"
+            assert process.state == []
 
             # Check result content
             assert not result.is_error
@@ -148,14 +152,15 @@ class TestGotoToolUnit:
     async def test_handle_goto_with_message(self):
         """Test handling a GOTO operation with a new message."""
         # Create a mock process with some messages
-        process = MagicMock()
-        process.state = [
-            {"role": "user", "content": "Message 1", LLMPROC_MSG_ID: 0},
-            {"role": "assistant", "content": "Response 1", LLMPROC_MSG_ID: 1},
-            {"role": "user", "content": "Message 2", LLMPROC_MSG_ID: 2},
-            {"role": "assistant", "content": "Response 2", LLMPROC_MSG_ID: 3},
-        ]
-        process.time_travel_history = []
+        process = SimpleNamespace(
+            state=[
+                {"role": "user", "content": "Message 1", LLMPROC_MSG_ID: 0},
+                {"role": "assistant", "content": "Response 1", LLMPROC_MSG_ID: 1},
+                {"role": "user", "content": "Message 2", LLMPROC_MSG_ID: 2},
+                {"role": "assistant", "content": "Response 2", LLMPROC_MSG_ID: 3},
+            ],
+            time_travel_history=[],
+        )
 
         # Create runtime context with the process
         runtime_context = {"process": process}
@@ -201,12 +206,13 @@ class TestGotoToolUnit:
     async def test_handle_goto_with_preformatted_message(self):
         """Test handling a GOTO operation with a pre-formatted time travel message."""
         # Create a mock process with some messages
-        process = MagicMock()
-        process.state = [
-            {"role": "user", "content": "Message 1", LLMPROC_MSG_ID: 0},
-            {"role": "assistant", "content": "Response 1", LLMPROC_MSG_ID: 1},
-        ]
-        process.time_travel_history = []
+        process = SimpleNamespace(
+            state=[
+                {"role": "user", "content": "Message 1", LLMPROC_MSG_ID: 0},
+                {"role": "assistant", "content": "Response 1", LLMPROC_MSG_ID: 1},
+            ],
+            time_travel_history=[],
+        )
 
         # Create runtime context with the process
         runtime_context = {"process": process}
@@ -259,11 +265,12 @@ class TestGotoToolUnit:
     async def test_handle_goto_errors(self):
         """Test error handling in the GOTO tool."""
         # Create a mock process with some messages
-        process = MagicMock()
-        process.state = [
-            {"role": "user", "content": "Message 1", LLMPROC_MSG_ID: 0},
-            {"role": "assistant", "content": "Response 1", LLMPROC_MSG_ID: 1},
-        ]
+        process = SimpleNamespace(
+            state=[
+                {"role": "user", "content": "Message 1", LLMPROC_MSG_ID: 0},
+                {"role": "assistant", "content": "Response 1", LLMPROC_MSG_ID: 1},
+            ],
+        )
 
         # Create runtime context with the process
         runtime_context = {"process": process}
@@ -286,11 +293,12 @@ class TestGotoToolUnit:
     @pytest.mark.asyncio
     async def test_handle_goto_missing_parameters(self):
         """Test GOTO tool with missing required parameters."""
-        process = MagicMock()
-        process.state = [
-            {"role": "user", "content": "Message 1", LLMPROC_MSG_ID: 0},
-            {"role": "assistant", "content": "Response 1", LLMPROC_MSG_ID: 1},
-        ]
+        process = SimpleNamespace(
+            state=[
+                {"role": "user", "content": "Message 1", LLMPROC_MSG_ID: 0},
+                {"role": "assistant", "content": "Response 1", LLMPROC_MSG_ID: 1},
+            ],
+        )
 
         # Create runtime context with the process
         runtime_context = {"process": process}